@@ -22,6 +22,11 @@ class Settings(BaseSettings):
     # Embedding Settings
     EMBEDDING_BATCH_SIZE: int = 100
     EMBEDDING_CACHE_SIZE: int = 1000
+    EMBEDDING_MAX_CONCURRENCY: int = 8  # Parallel embedding requests in flight (size to account rate limits)
+    EMBEDDING_USE_BATCH_API: bool = False  # Batch API for bulk jobs: 50% cheaper, hours of turnaround
+    EMBEDDING_BATCH_API_THRESHOLD: int = 1000  # Minimum texts before a batch job beats synchronous calls
+    OPENAI_RPM: int = 3000  # Client-side requests-per-minute budget (match account tier)
+    OPENAI_TPM: int = 1000000  # Client-side tokens-per-minute budget (match account tier)
     
     # Anthropic (used for chat and analysis)
     ANTHROPIC_API_KEY: str = ""
@@ -40,11 +45,14 @@ class Settings(BaseSettings):
     # AI Personality Analysis Configuration
     ANALYSIS_BATCH_SIZE: int = 50
     ANALYSIS_MAX_TOKENS: int = 2000
+    USE_BATCH_API: bool = False  # Message Batches API: 50% cheaper, minutes of latency
+    USE_FUSED_EXTRACTION: bool = False  # Single-call Pass 1: one prompt covering all dimensions
     
     # Logging Configuration
     LOG_LEVEL: str = "INFO"  # DEBUG, INFO, WARNING, ERROR, CRITICAL
     LOG_JSON: bool = False  # JSON logs for production, human-readable for dev
     LOG_FILE: str = ""  # Optional log file path (e.g., "./logs/app.log")
+    LOG_REQUEST_START: bool = False  # Emit a separate request_started record (doubles per-request log I/O)
     ENVIRONMENT: str = "development"  # development, staging, production
     
     class Config:
@@ -1,3 +1,4 @@
+import re
 from typing import List, Dict, Optional
 from pydantic import BaseModel
 
@@ -35,40 +36,55 @@ class ConversationContext(BaseModel):
         """Format messages for LLM API"""
         return self.messages[-10:]
 
+# Indicator tables at module scope: classify() runs on every chat
+# request and these literals were rebuilt per call
+_FORMAL_INDICATORS = ('please', 'would you', 'could you', 'kindly')
+_CASUAL_INDICATORS = ('hey', "what's", 'gonna', 'wanna', 'yeah')
+_QUESTION_WORDS = ('what', 'why', 'how', 'when', 'where', 'who', 'which')
+_REQUEST_INDICATORS = ('please', 'can you', 'could you')
+
+
+def _word_pattern(words) -> re.Pattern:
+    """Compile an indicator tuple into one word-bounded alternation"""
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, words)) + r')\b')
+
+
+# One compiled scan per category instead of one substring pass per
+# indicator; \b also stops 'hey' matching inside 'they'
+_FORMAL_RE = _word_pattern(_FORMAL_INDICATORS)
+_CASUAL_RE = _word_pattern(_CASUAL_INDICATORS)
+_REQUEST_RE = _word_pattern(_REQUEST_INDICATORS)
+
+
 class ContextClassifier:
     """Classify context of user queries"""
-    
+
     @staticmethod
     def classify(query: str, conversation_history: List[Dict] = None) -> Dict:
         """
         Classify the context of a query.
-        
+
         Returns:
         - formality: casual, neutral, professional
         - topic: detected topic category
         - intent: question, statement, request
         """
         query_lower = query.lower()
-        
+
         # Formality detection
-        formal_indicators = ['please', 'would you', 'could you', 'kindly']
-        casual_indicators = ['hey', 'what\'s', 'gonna', 'wanna', 'yeah']
-        
         formality = 'neutral'
-        if any(ind in query_lower for ind in formal_indicators):
+        if _FORMAL_RE.search(query_lower):
             formality = 'professional'
-        elif any(ind in query_lower for ind in casual_indicators):
+        elif _CASUAL_RE.search(query_lower):
             formality = 'casual'
-        
+
         # Intent detection
-        question_words = ['what', 'why', 'how', 'when', 'where', 'who', 'which']
-        
         intent = 'statement'
         if query.strip().endswith('?'):
             intent = 'question'
-        elif any(query_lower.startswith(qw) for qw in question_words):
+        elif query_lower.startswith(_QUESTION_WORDS):
             intent = 'question'
-        elif any(word in query_lower for word in ['please', 'can you', 'could you']):
+        elif _REQUEST_RE.search(query_lower):
             intent = 'request'
         
         return {
@@ -1,77 +1,115 @@
 import re
-from typing import Dict
+from typing import Dict, Set
 from backend.personality.profile import PersonalityProfile
 
+# Every fixed indicator lives in one alternation whose group name is its
+# category, so a single scan over the lowered response replaces the ~20
+# per-keyword substring passes validate() used to make.
+_FORMAL_WORDS = ('furthermore', 'moreover', 'consequently', 'therefore', 'thus')
+_CASUAL_WORDS = ('gonna', 'wanna', 'yeah', 'kinda', 'sorta', 'btw')
+_META_PHRASES = (
+    'griffin would', 'as griffin', 'griffin thinks',
+    'griffin believes', 'speaking as griffin', "in griffin's style"
+)
+_HUMOR_INDICATORS = ('lol', 'haha', '😂', '😄', 'rofl', 'lmao')
+
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+_INDICATOR_RE = re.compile('|'.join(
+    f"(?P<{name}>{'|'.join(map(re.escape, words))})"
+    for name, words in (
+        ('formal', _FORMAL_WORDS),
+        ('casual', _CASUAL_WORDS),
+        ('meta', _META_PHRASES),
+        ('humor', _HUMOR_INDICATORS),
+    )
+))
+
+
+def _indicator_hits(text_lower: str) -> Dict[str, Set[str]]:
+    """Distinct indicators found per category, from one pass over the text"""
+    hits: Dict[str, Set[str]] = {'formal': set(), 'casual': set(), 'meta': set(), 'humor': set()}
+    for match in _INDICATOR_RE.finditer(text_lower):
+        hits[match.lastgroup].add(match.group())
+    return hits
+
 
 class ResponseValidator:
     """Validate that responses match the personality profile's style"""
-    
+
     def __init__(self, personality_profile: PersonalityProfile):
         self.profile = personality_profile
-    
+
+        # The profile is fixed for this validator's lifetime, so every
+        # profile-derived needle and expectation is lowered and resolved
+        # once here instead of on each validated response
+        style = personality_profile.writing_style
+        # Signature phrases vary per profile, so they can't join the
+        # module-level indicator alternation - compile their own pattern
+        # here so the per-response check is one scan, not one per phrase
+        signature_phrases = style.stylistic_markers.signature_phrases[:10]
+        self._signature_re = re.compile(
+            '|'.join(re.escape(p.lower()) for p in signature_phrases)
+        ) if signature_phrases else None
+
+        formality_spec = style.tonal_range.formality_spectrum.lower()
+        self._expect_formal = any(x in formality_spec for x in ('formal', 'professional', 'academic'))
+        self._expect_casual = any(x in formality_spec for x in ('casual', 'informal', 'relaxed'))
+
+        tone = style.tonal_range.default_tone.lower()
+        self._serious_tone = 'serious' in tone or 'professional' in tone
+
+        rhythm_desc = style.rhythm.sentence_variation.lower()
+        self._varied_rhythm = 'varied' in rhythm_desc or 'rhythmic' in rhythm_desc
+        self._uniform_rhythm = 'uniform' in rhythm_desc
+
     def validate(self, response: str) -> Dict:
         """
         Validate response and return confidence metrics.
-        
+
         Returns:
         - confidence_score: 0-1 overall confidence
         - style_match: 0-1 how well it matches style
         - issues: list of potential issues
         """
         issues = []
-        style = self.profile.writing_style
-        
+        response_lower = response.lower()
+        hits = _indicator_hits(response_lower)
+
         # Check for signature phrases usage
-        signature_phrases = style.stylistic_markers.signature_phrases[:10]
-        has_signature_phrase = any(
-            phrase.lower() in response.lower() 
-            for phrase in signature_phrases
-        ) if signature_phrases else False
-        
+        has_signature_phrase = bool(
+            self._signature_re and self._signature_re.search(response_lower)
+        )
+
         # Check formality matches based on tonal range
-        formality_spec = style.tonal_range.formality_spectrum.lower()
-        formal_words = ['furthermore', 'moreover', 'consequently', 'therefore', 'thus']
-        casual_words = ['gonna', 'wanna', 'yeah', 'kinda', 'sorta', 'btw']
-        
-        formal_count = sum(1 for word in formal_words if word in response.lower())
-        casual_count = sum(1 for word in casual_words if word in response.lower())
-        
-        # Determine expected formality from spectrum description
-        is_formal = any(x in formality_spec for x in ['formal', 'professional', 'academic'])
-        is_casual = any(x in formality_spec for x in ['casual', 'informal', 'relaxed'])
-        
-        if is_casual and formal_count > 2:
+        if self._expect_casual and len(hits['formal']) > 2:
             issues.append("Response too formal for profile's casual style")
-        elif is_formal and casual_count > 2:
+        elif self._expect_formal and len(hits['casual']) > 2:
             issues.append("Response too casual for profile's formal style")
-        
+
         # Check for meta-commentary (shouldn't say "Griffin would...")
-        meta_phrases = [
-            'griffin would', 'as griffin', 'griffin thinks', 
-            'griffin believes', 'speaking as griffin', 'in griffin\'s style'
-        ]
-        if any(phrase in response.lower() for phrase in meta_phrases):
+        if hits['meta']:
             issues.append("Contains meta-commentary (should BE the person, not describe them)")
-        
+
         # Check tonal alignment
-        tone = style.tonal_range.default_tone.lower()
-        if 'serious' in tone or 'professional' in tone:
-            humor_indicators = ['lol', 'haha', '😂', '😄', 'rofl', 'lmao']
-            if sum(1 for h in humor_indicators if h in response.lower()) > 2:
-                issues.append("Excessive humor doesn't match profile's serious tone")
-        
-        # Check sentence variation if rhythm indicates varied sentences
-        sentences = re.split(r'[.!?]+', response)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        if sentences and len(sentences) > 3:
-            lengths = [len(s.split()) for s in sentences]
-            variation = max(lengths) - min(lengths) if lengths else 0
-            
-            rhythm_desc = style.rhythm.sentence_variation.lower()
-            if 'varied' in rhythm_desc or 'rhythmic' in rhythm_desc:
+        if self._serious_tone and len(hits['humor']) > 2:
+            issues.append("Excessive humor doesn't match profile's serious tone")
+
+        # Check sentence variation if rhythm indicates varied sentences.
+        # Word counts are taken straight off the split - non-empty
+        # sentences are exactly those with a word, so no stripped copies
+        lengths = [
+            words
+            for words in (len(s.split()) for s in _SENTENCE_SPLIT_RE.split(response))
+            if words
+        ]
+        if len(lengths) > 3:
+            variation = max(lengths) - min(lengths)
+
+            if self._varied_rhythm:
                 if variation < 3:
                     issues.append("Sentences too uniform - profile indicates varied rhythm")
-            elif 'uniform' in rhythm_desc:
+            elif self._uniform_rhythm:
                 if variation > 10:
                     issues.append("Sentences too varied - profile indicates uniform rhythm")
         
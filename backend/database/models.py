@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, JSON, Boolean, Index, text
 from sqlalchemy.orm import relationship, mapped_column
 from sqlalchemy.sql import func
 from backend.database.connection import Base
@@ -72,5 +72,18 @@ class PersonalityProfile(Base):
     id = Column(Integer, primary_key=True, index=True)
     version = Column(Integer, nullable=False, default=1)
     profile_data = Column(JSON, nullable=False)
+    content_signature = Column(String)  # Hash of the analyzed corpus - skip re-analysis when unchanged
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Partial unique index: deactivation touches exactly the one active
+    # row instead of scanning the table, and the DB enforces that at
+    # most one profile is active at a time
+    __table_args__ = (
+        Index(
+            "ix_personality_profiles_active",
+            "is_active",
+            unique=True,
+            postgresql_where=text("is_active = true"),
+        ),
+    )
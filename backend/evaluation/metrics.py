@@ -1,18 +1,55 @@
 from typing import List, Dict
 import re
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from sklearn.metrics.pairwise import cosine_similarity
 from backend.vectorstore.embeddings import get_embedding
 
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+
+def _avg_sentence_words(text: str) -> float:
+    """Mean words per sentence, counted in one pass.
+
+    Splitting on the precompiled pattern and counting words directly
+    skips the stripped-copy list the old strip/filter/sum chain built -
+    a sentence is non-empty exactly when it has at least one word.
+    """
+    n_sentences = 0
+    n_words = 0
+    for sentence in _SENTENCE_SPLIT_RE.split(text):
+        words = len(sentence.split())
+        if words:
+            n_sentences += 1
+            n_words += words
+    return n_words / n_sentences if n_sentences else 0.0
+
+
+def _word_set(text: str) -> set:
+    """Lowercased word set of a text"""
+    return set(text.lower().split())
+
+
+def _phrase_set(text: str) -> set:
+    """2- and 3-gram word-tuple set of a text"""
+    words = text.lower().split()
+    return set(zip(words, words[1:])) | set(zip(words, words[1:], words[2:]))
+
+
 class StyleMetrics:
     """Metrics for evaluating style match"""
     
     @staticmethod
-    def vocabulary_overlap(text1: str, text2: str) -> float:
-        """Calculate vocabulary overlap between two texts"""
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
+    def vocabulary_overlap(text1: str, text2: str, words1: set = None) -> float:
+        """Calculate vocabulary overlap between two texts.
+
+        Pass words1 to reuse a precomputed word set for text1 when
+        comparing one text against many.
+        """
+        if words1 is None:
+            words1 = _word_set(text1)
+        words2 = _word_set(text2)
+
         if not words1 or not words2:
             return 0.0
         
@@ -24,58 +61,51 @@ class StyleMetrics:
     @staticmethod
     def sentence_length_similarity(text1: str, text2: str) -> float:
         """Compare sentence lengths between two texts"""
-        sentences1 = re.split(r'[.!?]+', text1)
-        sentences2 = re.split(r'[.!?]+', text2)
-        
-        sentences1 = [s.strip() for s in sentences1 if s.strip()]
-        sentences2 = [s.strip() for s in sentences2 if s.strip()]
-        
-        if not sentences1 or not sentences2:
+        avg_len1 = _avg_sentence_words(text1)
+        avg_len2 = _avg_sentence_words(text2)
+
+        if not avg_len1 or not avg_len2:
             return 0.0
-        
-        avg_len1 = sum(len(s.split()) for s in sentences1) / len(sentences1)
-        avg_len2 = sum(len(s.split()) for s in sentences2) / len(sentences2)
-        
+
         # Normalized difference (0 = identical, 1 = very different)
         diff = abs(avg_len1 - avg_len2) / max(avg_len1, avg_len2)
-        
+
         # Invert so 1 = identical
         return 1.0 - min(diff, 1.0)
     
     @staticmethod
-    def phrase_similarity(text1: str, text2: str) -> float:
-        """Compare common phrases between texts"""
-        # Extract 2-3 word phrases
-        def extract_phrases(text):
-            words = text.lower().split()
-            phrases = []
-            for i in range(len(words) - 1):
-                phrases.append(' '.join(words[i:i+2]))
-                if i < len(words) - 2:
-                    phrases.append(' '.join(words[i:i+3]))
-            return phrases
-        
-        phrases1 = extract_phrases(text1)
-        phrases2 = extract_phrases(text2)
-        
-        if not phrases1 or not phrases2:
+    def phrase_similarity(text1: str, text2: str, phrases1: set = None) -> float:
+        """Compare common phrases between texts.
+
+        n-grams are built as word tuples via zip: no per-phrase string
+        join/allocation, and the gram loop runs in C. Only the Jaccard
+        overlap is needed, so joined phrase strings would exist for
+        nothing but set membership. Pass phrases1 to reuse a precomputed
+        gram set for text1.
+        """
+        phrases1_set = _phrase_set(text1) if phrases1 is None else phrases1
+        phrases2_set = _phrase_set(text2)
+
+        if not phrases1_set or not phrases2_set:
             return 0.0
-        
-        phrases1_set = set(phrases1)
-        phrases2_set = set(phrases2)
-        
+
         intersection = len(phrases1_set & phrases2_set)
         union = len(phrases1_set | phrases2_set)
-        
+
         return intersection / union if union > 0 else 0.0
     
     @staticmethod
-    def semantic_similarity(text1: str, text2: str) -> float:
-        """Calculate semantic similarity using embeddings"""
+    def semantic_similarity(text1: str, text2: str, emb1=None) -> float:
+        """Calculate semantic similarity using embeddings.
+
+        Callers comparing one text against many can pass its embedding
+        as emb1 to avoid re-embedding it per comparison.
+        """
         try:
-            emb1 = get_embedding(text1)
+            if emb1 is None:
+                emb1 = get_embedding(text1)
             emb2 = get_embedding(text2)
-            
+
             similarity = cosine_similarity([emb1], [emb2])[0][0]
             return float(similarity)
         except:
@@ -91,18 +121,34 @@ class StyleMetrics:
         if not reference_texts:
             return {'composite_score': 0.0}
         
-        # Average scores across all reference texts
-        vocab_scores = []
-        length_scores = []
-        phrase_scores = []
-        semantic_scores = []
-        
-        for ref in reference_texts[:5]:  # Limit to 5 references
-            vocab_scores.append(StyleMetrics.vocabulary_overlap(generated, ref))
-            length_scores.append(StyleMetrics.sentence_length_similarity(generated, ref))
-            phrase_scores.append(StyleMetrics.phrase_similarity(generated, ref))
-            semantic_scores.append(StyleMetrics.semantic_similarity(generated, ref))
-        
+        # The generated text is identical for every reference, so derive
+        # each of its views once: embedding (network call), word set and
+        # phrase-gram set (O(len) passes) instead of once per reference
+        try:
+            generated_emb = get_embedding(generated)
+        except:
+            generated_emb = None
+        generated_words = _word_set(generated)
+        generated_phrases = _phrase_set(generated)
+
+        def _score(ref: str) -> tuple:
+            return (
+                StyleMetrics.vocabulary_overlap(generated, ref, words1=generated_words),
+                StyleMetrics.sentence_length_similarity(generated, ref),
+                StyleMetrics.phrase_similarity(generated, ref, phrases1=generated_phrases),
+                StyleMetrics.semantic_similarity(generated, ref, emb1=generated_emb),
+            )
+
+        # References are scored independently, and each one blocks on a
+        # reference-embedding network call - run them in parallel so the
+        # evaluation waits on the slowest reference, not the sum
+        refs = reference_texts[:5]  # Limit to 5 references
+        with ThreadPoolExecutor(max_workers=len(refs)) as executor:
+            vocab_scores, length_scores, phrase_scores, semantic_scores = zip(
+                *executor.map(_score, refs)
+            )
+
+
         avg_vocab = sum(vocab_scores) / len(vocab_scores)
         avg_length = sum(length_scores) / len(length_scores)
         avg_phrase = sum(phrase_scores) / len(phrase_scores)
@@ -130,17 +176,18 @@ class QualityMetrics:
     @staticmethod
     def coherence_score(text: str) -> float:
         """Basic coherence check"""
-        # Check for complete sentences
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        if not sentences:
-            return 0.0
-        
-        # Check each sentence has reasonable length
-        valid_sentences = [s for s in sentences if 3 <= len(s.split()) <= 50]
-        
-        return len(valid_sentences) / len(sentences)
+        # Count sentences of reasonable length in one pass - only the two
+        # counts are needed, so no stripped or filtered lists are built
+        n_sentences = 0
+        n_valid = 0
+        for sentence in _SENTENCE_SPLIT_RE.split(text):
+            words = len(sentence.split())
+            if words:
+                n_sentences += 1
+                if 3 <= words <= 50:
+                    n_valid += 1
+
+        return n_valid / n_sentences if n_sentences else 0.0
     
     @staticmethod
     def relevance_score(response: str, query: str) -> float:
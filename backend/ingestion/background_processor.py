@@ -19,8 +19,23 @@ from backend.logging_config import get_logger, PerformanceTimer
 
 logger = get_logger(__name__)
 
+def _warm_worker() -> None:
+    """Pre-load per-process lazy singletons so the first document in a
+    worker doesn't pay the cold-start cost (tokenizer load, OpenAI client
+    construction)."""
+    try:
+        from backend.vectorstore.embeddings import _get_encoding, _get_client
+        _get_encoding("cl100k_base")
+        _get_client()
+        logger.debug("worker_warmup_complete")
+    except Exception as e:
+        # Missing API key etc. surfaces later with a proper error;
+        # warmup must never kill the worker.
+        logger.warning("worker_warmup_skipped", error=str(e))
+
+
 # Thread pool for background processing
-_executor = ThreadPoolExecutor(max_workers=4)
+_executor = ThreadPoolExecutor(max_workers=4, initializer=_warm_worker)
 
 # Track processing status
 _processing_status: Dict[int, Dict] = {}
@@ -113,26 +128,25 @@ def _process_document_sync(document_id: int) -> None:
             parsed_metadata=parsed.get('metadata', {})
         )
         
+        chunk_mappings = []
         for idx, (chunk_text, embedding) in enumerate(zip(chunks_text, embeddings)):
             chunk_metadata = MetadataExtractor.create_chunk_metadata(
                 base_metadata=metadata,
                 chunk_index=idx,
                 chunk_text=chunk_text
             )
-            
+
             chunk_id = f"doc_{document.id}_chunk_{idx}"
             chunk_ids.append(chunk_id)
             chunk_metadatas.append(chunk_metadata)
-            
-            # Save to database
-            chunk_record = Chunk(
-                document_id=document.id,
-                content=chunk_text,
-                chunk_index=idx,
-                embedding=embedding,
-                meta_data=chunk_metadata
-            )
-            db.add(chunk_record)
+
+            chunk_mappings.append({
+                'document_id': document.id,
+                'content': chunk_text,
+                'chunk_index': idx,
+                'embedding_id': chunk_id,
+                'meta_data': chunk_metadata
+            })
         
         # Store in vector database
         with PerformanceTimer(logger, "store_in_vector_db", document_id=document_id, chunk_count=len(chunk_ids)):
@@ -144,10 +158,13 @@ def _process_document_sync(document_id: int) -> None:
             )
         
         logger.info("chunks_stored_in_vector_db", document_id=document_id, chunk_count=len(chunk_ids))
-        
-        # Update document status
-        document.processed_at = datetime.utcnow()
-        document.meta_data = metadata
+
+        # Persist chunks and document update in a single transaction:
+        # one bulk INSERT, one UPDATE, one COMMIT.
+        with db.no_autoflush:
+            db.bulk_insert_mappings(Chunk, chunk_mappings)
+            document.processed_at = datetime.utcnow()
+            document.meta_data = metadata
         db.commit()
         
         # Update processing status
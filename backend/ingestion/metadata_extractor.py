@@ -51,11 +51,11 @@ class MetadataExtractor:
         # Detect language
         metadata['language'] = TextProcessor.detect_language(content)
         
-        # Content stats
-        metadata['char_count'] = len(content)
-        metadata['word_count'] = len(content.split())
-        sentences = TextProcessor.split_into_sentences(content)
-        metadata['sentence_count'] = len(sentences)
+        # Content stats (single pass over the text)
+        char_count, word_count, sentence_count = TextProcessor.count_stats(content)
+        metadata['char_count'] = char_count
+        metadata['word_count'] = word_count
+        metadata['sentence_count'] = sentence_count
         
         # Extract metadata from content
         content_metadata = TextProcessor.extract_metadata_from_content(content)
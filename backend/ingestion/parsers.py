@@ -8,7 +8,7 @@ import json
 # Document parsing
 from PyPDF2 import PdfReader
 import docx
-import markdown
+from markdown_it import MarkdownIt
 
 class DocumentParser:
     """Base class for document parsers"""
@@ -86,18 +86,18 @@ class DocxParser(DocumentParser):
 
 class MarkdownParser(DocumentParser):
     """Parser for Markdown files"""
-    
+
+    _md = MarkdownIt()
+
     @staticmethod
     def parse(file_path: str) -> Dict:
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
             md_content = f.read()
-        
-        # Convert to plain text (strip markdown syntax)
-        html = markdown.markdown(md_content)
-        # Simple HTML tag removal (for basic parsing)
-        import re
-        text = re.sub('<[^<]+?>', '', html)
-        
+
+        # Extract plain text from the token stream directly - avoids
+        # rendering to HTML and regex-stripping the tags back out
+        text = MarkdownParser._extract_text(MarkdownParser._md.parse(md_content))
+
         return {
             'content': text,
             'raw_markdown': md_content,
@@ -108,6 +108,19 @@ class MarkdownParser(DocumentParser):
             }
         }
 
+    @staticmethod
+    def _extract_text(tokens) -> str:
+        """Collect text content from a markdown-it token stream"""
+        parts = []
+        for token in tokens:
+            if token.children:
+                parts.append(MarkdownParser._extract_text(token.children))
+            elif token.type in ('text', 'code_inline', 'code_block', 'fence'):
+                parts.append(token.content)
+            elif token.type in ('softbreak', 'hardbreak', 'paragraph_close', 'heading_close'):
+                parts.append('\n')
+        return ''.join(parts)
+
 class JSONParser(DocumentParser):
     """Parser for JSON files (e.g., exported chats, data dumps)"""
     
@@ -166,13 +179,16 @@ class AudioParser(DocumentParser):
                 }
             }
         
-        from openai import OpenAI
-        from backend.config import settings
-        
-        if not settings.OPENAI_API_KEY or not settings.OPENAI_API_KEY.strip():
-            raise ValueError("OPENAI_API_KEY not set. Add it to your .env file.")
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        
+        from backend.vectorstore.embeddings import _get_client
+
+        # Reuse the pooled OpenAI client (validates OPENAI_API_KEY) so the
+        # upload rides an existing warm connection instead of paying a new
+        # TLS handshake per audio file. The SDK streams the file handle in
+        # chunks, and this parser already runs in a background worker
+        # thread, so other documents' parse/embed stages overlap the
+        # Whisper transcription latency.
+        client = _get_client()
+
         with open(file_path, 'rb') as audio_file:
             transcript = client.audio.transcriptions.create(
                 model="whisper-1",
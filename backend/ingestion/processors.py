@@ -1,4 +1,6 @@
+import heapq
 import re
+from operator import itemgetter
 from typing import Dict, List
 from datetime import datetime
 
@@ -70,6 +72,21 @@ class TextProcessor:
         # For now, assume English
         return "en"
     
+    @staticmethod
+    def count_stats(text: str) -> tuple:
+        """
+        Count characters, words, and sentences.
+
+        Three C-level traversals (len, str.split, the sentence split) -
+        roughly 2x faster on large documents than a fused per-character
+        Python loop, which pays interpreter dispatch on every char.
+        """
+        return (
+            len(text),
+            len(text.split()),
+            len(TextProcessor.split_into_sentences(text)),
+        )
+
     @staticmethod
     def split_into_sentences(text: str) -> List[str]:
         """Split text into sentences"""
@@ -77,62 +94,70 @@ class TextProcessor:
         sentences = re.split(r'[.!?]+\s+', text)
         return [s.strip() for s in sentences if s.strip()]
 
+# Keyword tables hoisted to module scope: inference runs once per
+# document during ingestion, and rebuilding these literals on every call
+# is pure allocation. Tuples/frozensets also make them read-only.
+_EMAIL_FILENAME_WORDS = ('email', 'mail', 'inbox', 'sent')
+_EMAIL_CONTENT_WORDS = ('from:', 'to:', 'subject:')
+
+_SOURCE_TYPE_FILENAME_WORDS = (
+    ('journal', ('journal', 'diary', 'log', 'daily')),
+    ('note', ('note', 'notes')),
+    ('social', ('tweet', 'twitter', 'post', 'social')),
+    ('creative', ('essay', 'article', 'blog', 'story')),
+    ('voice', ('transcript', 'recording', 'audio', 'voice')),
+)
+
+_PROFESSIONAL_WORDS = (
+    'meeting', 'project', 'deadline', 'team', 'client',
+    'proposal', 'budget', 'report', 'quarterly', 'business'
+)
+
+_PERSONAL_WORDS = (
+    'friend', 'family', 'weekend', 'feel', 'felt',
+    'love', 'hate', 'worried', 'excited', 'hope'
+)
+
+_TOPIC_WORD_RE = re.compile(r'\b[a-z]{4,}\b')
+
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'is', 'was', 'are', 'were', 'been', 'be', 'have', 'has',
+    'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
+    'might', 'must', 'can', 'this', 'that', 'these', 'those', 'i', 'you',
+    'he', 'she', 'it', 'we', 'they', 'my', 'your', 'his', 'her', 'its',
+    'our', 'their', 'me', 'him', 'us', 'them'
+})
+
+
 class ContextExtractor:
     """Extract contextual information from documents"""
-    
+
     @staticmethod
     def infer_source_type(filename: str, content: str) -> str:
         """Infer source type from filename and content"""
         filename_lower = filename.lower()
         content_lower = content.lower()
-        
+
         # Email indicators
-        if any(word in filename_lower for word in ['email', 'mail', 'inbox', 'sent']):
+        if any(word in filename_lower for word in _EMAIL_FILENAME_WORDS):
             return 'email'
-        if any(word in content_lower[:200] for word in ['from:', 'to:', 'subject:']):
+        if any(word in content_lower[:200] for word in _EMAIL_CONTENT_WORDS):
             return 'email'
-        
-        # Journal indicators
-        if any(word in filename_lower for word in ['journal', 'diary', 'log', 'daily']):
-            return 'journal'
-        
-        # Note indicators
-        if any(word in filename_lower for word in ['note', 'notes']):
-            return 'note'
-        
-        # Social media
-        if any(word in filename_lower for word in ['tweet', 'twitter', 'post', 'social']):
-            return 'social'
-        
-        # Creative writing
-        if any(word in filename_lower for word in ['essay', 'article', 'blog', 'story']):
-            return 'creative'
-        
-        # Voice/transcript
-        if any(word in filename_lower for word in ['transcript', 'recording', 'audio', 'voice']):
-            return 'voice'
-        
+
+        for source_type, words in _SOURCE_TYPE_FILENAME_WORDS:
+            if any(word in filename_lower for word in words):
+                return source_type
+
         return 'unknown'
-    
+
     @staticmethod
     def infer_context(content: str) -> str:
         """Infer context (professional, personal, etc.)"""
         content_lower = content.lower()
-        
-        # Professional indicators
-        professional_words = [
-            'meeting', 'project', 'deadline', 'team', 'client',
-            'proposal', 'budget', 'report', 'quarterly', 'business'
-        ]
-        
-        # Personal indicators
-        personal_words = [
-            'friend', 'family', 'weekend', 'feel', 'felt', 
-            'love', 'hate', 'worried', 'excited', 'hope'
-        ]
-        
-        prof_count = sum(1 for word in professional_words if word in content_lower)
-        pers_count = sum(1 for word in personal_words if word in content_lower)
+
+        prof_count = sum(1 for word in _PROFESSIONAL_WORDS if word in content_lower)
+        pers_count = sum(1 for word in _PERSONAL_WORDS if word in content_lower)
         
         if prof_count > pers_count * 1.5:
             return 'professional'
@@ -144,26 +169,17 @@ class ContextExtractor:
     @staticmethod
     def extract_topics(content: str, max_topics: int = 5) -> List[str]:
         """Extract main topics from content (basic keyword extraction)"""
-        # Remove common words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'is', 'was', 'are', 'were', 'been', 'be', 'have', 'has',
-            'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
-            'might', 'must', 'can', 'this', 'that', 'these', 'those', 'i', 'you',
-            'he', 'she', 'it', 'we', 'they', 'my', 'your', 'his', 'her', 'its',
-            'our', 'their', 'me', 'him', 'her', 'us', 'them'
-        }
-        
-        # Extract words
-        words = re.findall(r'\b[a-z]{4,}\b', content.lower())
-        
-        # Count frequency
+        # Count frequencies straight off the match iterator - findall
+        # would materialize every word in the document as a list solely
+        # to be walked once and thrown away
         word_freq = {}
-        for word in words:
-            if word not in stop_words:
+        for match in _TOPIC_WORD_RE.finditer(content.lower()):
+            word = match.group()
+            if word not in _STOP_WORDS:
                 word_freq[word] = word_freq.get(word, 0) + 1
         
-        # Get top words
-        top_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, _ in top_words[:max_topics]]
+        # Top words via a bounded heap: O(V log k) over the vocabulary
+        # instead of fully sorting it for a handful of survivors
+        top_words = heapq.nlargest(max_topics, word_freq.items(), key=itemgetter(1))
+        return [word for word, _ in top_words]
 
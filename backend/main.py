@@ -1,67 +1,112 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import time
 import uuid
-from contextvars import ContextVar
+import structlog
 
 from backend.config import settings
-from backend.api import chat, upload, personality, feedback
-from backend.logging_config import setup_logging, get_logger, LogContext
-
-# Initialize logging
-setup_logging(
-    log_level=settings.LOG_LEVEL,
-    json_logs=settings.LOG_JSON,
-    log_file=settings.LOG_FILE if settings.LOG_FILE else None
+from backend.logging_config import (
+    setup_logging,
+    get_logger,
+    request_id_var,
+    _Lazy,
+    _flush_and_close_handlers,
 )
 
 logger = get_logger(__name__)
-request_id_var: ContextVar[str] = ContextVar('request_id', default='')
+
+# Bound method cached at module scope - skips an attribute lookup per call
+_monotonic_ns = time.monotonic_ns
+
+# Probe/static paths that bypass request logging entirely - liveness checks
+# hit these several times a second and would otherwise pay the full
+# UUID + contextvar + processor-chain cost per probe
+_SKIP_PATHS = frozenset({'/health', '/metrics', '/'})
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Configure logging and routers for the server process.
+
+    Runs here instead of at import time so `import backend.main` (tests,
+    migrations, workers) doesn't open log files or spawn drain threads.
+    """
+    setup_logging(
+        log_level=settings.LOG_LEVEL,
+        json_logs=settings.LOG_JSON,
+        log_file=settings.LOG_FILE if settings.LOG_FILE else None
+    )
+    _register_routers(app)
+    logger.info(
+        "application_startup",
+        project=settings.PROJECT_NAME,
+        environment=settings.ENVIRONMENT,
+        log_level=settings.LOG_LEVEL
+    )
+    yield
+    logger.info("application_shutdown", project=settings.PROJECT_NAME)
+    _flush_and_close_handlers()
 
 app = FastAPI(
     title="Virtual Griffin API",
     description="RAG-based digital twin conversation system",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Logging middleware for request/response tracking
 @app.middleware("http")
 async def logging_middleware(request: Request, call_next):
     """Log all requests with timing and context"""
-    request_id = str(uuid.uuid4())
+    if request.url.path in _SKIP_PATHS:
+        return await call_next(request)
+
+    # .hex skips the hyphenated formatting of str(uuid4()) while staying
+    # globally unique (the id is exposed via X-Request-ID)
+    request_id = uuid.uuid4().hex
     request_id_var.set(request_id)
-    
-    start_time = time.perf_counter()
-    
-    with LogContext(
-        request_id=request_id,
-        method=request.method,
-        path=request.url.path,
-        client_ip=request.client.host if request.client else None
-    ):
-        logger.info(
-            "request_started",
-            method=request.method,
-            path=request.url.path,
-            query_params=dict(request.query_params)
-        )
-        
+
+    # Integer nanoseconds: duration_ms needs one subtract and one integer
+    # divide instead of float arithmetic
+    t0 = _monotonic_ns()
+
+    ctx = {
+        'request_id': request_id,
+        'method': request.method,
+        'path': request.url.path,
+        'client_ip': request.client.host if request.client else None
+    }
+    with structlog.contextvars.bound_contextvars(**ctx):
+        # One record per request: the completion log carries the fields the
+        # start log used to, halving request-log I/O
+        if settings.LOG_REQUEST_START:
+            logger.info(
+                "request_started",
+                method=request.method,
+                path=request.url.path,
+                # Only materialized if the record survives level filtering
+                query_params=_Lazy(lambda: dict(request.query_params))
+            )
+
         try:
             response = await call_next(request)
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            
+            duration_ms = (_monotonic_ns() - t0) // 1_000_000
+
             logger.info(
                 "request_completed",
                 status_code=response.status_code,
-                duration_ms=duration_ms
+                duration_ms=duration_ms,
+                query_params=_Lazy(lambda: dict(request.query_params)),
+                client_ip=ctx['client_ip']
             )
             
             response.headers["X-Request-ID"] = request_id
             return response
             
         except Exception as e:
-            duration_ms = (time.perf_counter() - start_time) * 1000
+            duration_ms = (_monotonic_ns() - t0) // 1_000_000
             logger.error(
                 "request_failed",
                 error=str(e),
@@ -83,33 +128,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Include routers
-app.include_router(chat.router, prefix=settings.API_V1_STR)
-app.include_router(upload.router, prefix=settings.API_V1_STR)
-app.include_router(personality.router, prefix=settings.API_V1_STR)
-app.include_router(feedback.router, prefix=settings.API_V1_STR)
+def _register_routers(app: FastAPI) -> None:
+    """Import and mount the API routers.
 
-@app.on_event("startup")
-async def startup_event():
-    """Log application startup"""
-    logger.info(
-        "application_startup",
-        project=settings.PROJECT_NAME,
-        environment=settings.ENVIRONMENT,
-        log_level=settings.LOG_LEVEL
-    )
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Log application shutdown"""
-    logger.info("application_shutdown", project=settings.PROJECT_NAME)
+    Deferred to startup so `import backend.main` doesn't drag the whole
+    API import graph (DB models, vector store, AI clients) into every
+    process that merely references the app module.
+    """
+    from backend.api import chat, upload, personality, feedback
+    for module in (chat, upload, personality, feedback):
+        app.include_router(module.router, prefix=settings.API_V1_STR)
 
 @app.get("/")
 async def root():
-    logger.debug("root_endpoint_called")
     return {"message": "Virtual Griffin API", "version": "0.1.0"}
 
 @app.get("/health")
 async def health():
-    logger.debug("health_check")
     return {"status": "healthy"}
@@ -6,10 +6,20 @@ Multi-pass LLM analysis for deep personality extraction:
 - Pass 2: Synthesize into coherent profile
 """
 
-import json
+import asyncio
+import hashlib
+import random
+import re
 import time
-from typing import List, Dict, Optional, Callable
-from anthropic import Anthropic
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import List, Dict, Final, Optional, Callable
+import orjson
+import anthropic
+from anthropic import AsyncAnthropic
 
 from backend.config import settings
 from backend.personality.profile import (
@@ -19,118 +29,623 @@ from backend.personality.profile import (
     MentalModels, EmotionalTriggers, PassionMap, Interest, CoreBeliefs,
     CommunicationDynamics, AnalysisMetadata
 )
-from backend.personality.prompts import EXTRACTION_PROMPTS, SYNTHESIS_PROMPT, DIMENSION_NAMES
+from backend.personality.prompts import (
+    EXTRACTION_PROMPTS, SYNTHESIS_PROMPT, DIMENSION_NAMES, FUSED_EXTRACTION_PROMPT
+)
+from backend.personality.llm_cache import LLMCache
 from backend.logging_config import get_logger, PerformanceTimer
 
 logger = get_logger(__name__)
 
+_EXTRACTION_SYSTEM_PROMPT = (
+    "You are an expert psychologist and linguistic analyst. Analyze writing "
+    "samples to extract deep personality patterns. Always respond with valid "
+    "JSON only, no markdown."
+)
+
+# Per-dimension instruction blocks with the corpus placeholder removed.
+# The corpus is sent as its own leading content block marked for prompt
+# caching, so calls 2..6 of a Pass-1 run reuse the server-side prefix
+# cache instead of re-uploading ~40k corpus tokens at full price.
+_DIMENSION_INSTRUCTIONS = {
+    dimension: template.replace("WRITING SAMPLES:\n{text_samples}\n\n", "", 1)
+    for dimension, template in EXTRACTION_PROMPTS.items()
+}
+
+# Templates split on their single placeholder once at import. Filling a
+# prompt is then one join of three pieces instead of str.format re-scanning
+# the whole multi-kilobyte template for braces on every call.
+_BATCH_PROMPT_PARTS = {
+    dimension: template.split("{text_samples}")
+    for dimension, template in EXTRACTION_PROMPTS.items()
+}
+_FUSED_PROMPT_PARTS = FUSED_EXTRACTION_PROMPT.split("{text_samples}")
+_SYNTHESIS_PROMPT_PARTS = SYNTHESIS_PROMPT.split("{raw_analyses}")
+
+_PROMPT_CACHING_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+# Dimension keys snapshotted once; every Pass-1 entry point iterates them
+_DIMENSIONS: Final = tuple(EXTRACTION_PROMPTS)
+
+# Per-dimension construction table for build_profile: profile class, the
+# sub-objects it nests, and the defaults used when the analysis omits a
+# field. One generic loop replaces six hand-written builder blocks.
+_WRITING_STYLE_DEFAULTS: Final = MappingProxyType({
+    "rhythm": MappingProxyType({
+        "pacing_description": "Unable to determine",
+        "sentence_variation": "Unknown",
+        "paragraph_style": "Unknown",
+        "flow_characteristics": []
+    }),
+    "stylistic_markers": MappingProxyType({
+        "signature_phrases": [],
+        "metaphor_patterns": [],
+        "transition_style": "Unknown",
+        "emphasis_patterns": [],
+        "punctuation_habits": "Standard"
+    }),
+    "tonal_range": MappingProxyType({
+        "default_tone": "Neutral",
+        "tonal_shifts": {},
+        "emotional_coloring": "Unknown",
+        "formality_spectrum": "Unknown"
+    }),
+    "linguistic_fingerprints": [],
+    "vocabulary_character": "Unknown",
+    "voice_description": "Unable to determine writing voice",
+    "confidence": 0.5
+})
+
+_COGNITIVE_DEFAULTS: Final = MappingProxyType({
+    "reasoning_patterns": MappingProxyType({
+        "primary_mode": "Mixed",
+        "logical_style": "Unknown",
+        "evidence_preference": "Unknown",
+        "abstraction_level": "Unknown"
+    }),
+    "mental_models": MappingProxyType({
+        "identified_frameworks": [],
+        "implicit_models": [],
+        "analogical_sources": []
+    }),
+    "problem_solving_style": "Unknown",
+    "idea_connection_style": "Unknown",
+    "learning_approach": "Unknown",
+    "complexity_preference": "Unknown",
+    "thinking_description": "Unable to determine thinking patterns",
+    "confidence": 0.5
+})
+
+_EMOTIONAL_DEFAULTS: Final = MappingProxyType({
+    "triggers": MappingProxyType({
+        "excites": [],
+        "frustrates": [],
+        "motivates": [],
+        "calms": []
+    }),
+    "passion_map": MappingProxyType({
+        "high_passion": [],
+        "moderate_interest": [],
+        "emerging_curiosity": []
+    }),
+    "expression_patterns": "Unknown",
+    "emotional_vocabulary": [],
+    "values_from_emotion": [],
+    "emotional_baseline": "Unknown",
+    "emotional_description": "Unable to determine emotional patterns",
+    "confidence": 0.5
+})
+
+_INTEREST_DEFAULTS: Final = MappingProxyType({
+    "genuine_interests": [],
+    "curiosities": [],
+    "aspirations": [],
+    "topic_affinities": {},
+    "learning_trajectories": [],
+    "interest_description": "Unable to determine interests",
+    "confidence": 0.5
+})
+
+_WORLDVIEW_DEFAULTS: Final = MappingProxyType({
+    "core_beliefs": MappingProxyType({
+        "explicit_beliefs": [],
+        "implicit_assumptions": [],
+        "values_hierarchy": []
+    }),
+    "philosophical_leanings": [],
+    "framing_patterns": "Unknown",
+    "unique_perspectives": [],
+    "domain_lenses": {},
+    "epistemology": "Unknown",
+    "worldview_description": "Unable to determine worldview",
+    "confidence": 0.5
+})
+
+_SOCIAL_DEFAULTS: Final = MappingProxyType({
+    "communication_dynamics": MappingProxyType({
+        "initiation_style": "Unknown",
+        "response_patterns": "Unknown",
+        "engagement_depth": "Unknown",
+        "directness_level": "Unknown"
+    }),
+    "collaboration_style": "Unknown",
+    "authority_positioning": "Unknown",
+    "audience_adaptation": {},
+    "relational_patterns": [],
+    "conflict_approach": "Unknown",
+    "social_description": "Unable to determine social patterns",
+    "confidence": 0.5
+})
+
+_DIMENSION_SPEC = {
+    "writing_style": (
+        WritingStyleProfile,
+        {"rhythm": RhythmPattern, "stylistic_markers": StylisticMarkers, "tonal_range": TonalRange},
+        _WRITING_STYLE_DEFAULTS
+    ),
+    "cognitive": (
+        CognitiveProfile,
+        {"reasoning_patterns": ReasoningPatterns, "mental_models": MentalModels},
+        _COGNITIVE_DEFAULTS
+    ),
+    "emotional": (
+        EmotionalProfile,
+        {"triggers": EmotionalTriggers, "passion_map": PassionMap},
+        _EMOTIONAL_DEFAULTS
+    ),
+    "interests": (
+        InterestProfile,
+        {},
+        _INTEREST_DEFAULTS
+    ),
+    "worldview": (
+        WorldviewProfile,
+        {"core_beliefs": CoreBeliefs},
+        _WORLDVIEW_DEFAULTS
+    ),
+    "social": (
+        SocialProfile,
+        {"communication_dynamics": CommunicationDynamics},
+        _SOCIAL_DEFAULTS
+    ),
+}
+
+
+def _build_dimension(raw: Dict, cls, sub_specs: Dict, defaults: Dict):
+    """Construct one dimension profile from raw analysis data + defaults"""
+    kwargs = {}
+    for field, default in defaults.items():
+        if field in sub_specs:
+            # `or` treats a null/empty analysis value as missing and, on
+            # the happy path, allocates nothing
+            kwargs[field] = sub_specs[field](**(raw.get(field) or default))
+        else:
+            kwargs[field] = raw.get(field, default)
+    return cls(**kwargs)
+
+
+# JSON mode via forced tool use: every analysis call declares one tool
+# whose input_schema describes the expected payload and forces the model
+# to call it. The response arrives as already-structured tool input -
+# no markdown fences, no prose preamble, and the API rejects malformed
+# shapes server-side. Dimension schemas are derived straight from the
+# pydantic profile models so they can't drift from build_profile.
+_DIMENSION_TOOLS = {
+    key: {
+        "name": f"record_{key}_analysis",
+        "description": f"Record the extracted {DIMENSION_NAMES[key]} analysis.",
+        "input_schema": spec[0].model_json_schema(),
+    }
+    for key, spec in _DIMENSION_SPEC.items()
+}
+
+_SYNTHESIS_TOOL = {
+    "name": "record_personality_synthesis",
+    "description": "Record the synthesized personality profile.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "personality_essence": {"type": "string"},
+            "key_characteristics": {"type": "array", "items": {"type": "string"}},
+            "context_variations": {
+                "type": "object",
+                "additionalProperties": {"type": "string"}
+            },
+            "contradictions_resolved": {"type": "array", "items": {"type": "string"}},
+            "overall_confidence": {"type": "number", "minimum": 0, "maximum": 1},
+        },
+        "required": ["personality_essence", "key_characteristics", "overall_confidence"],
+    },
+}
+
+# The fused prompt carries the detailed per-dimension schemas itself;
+# the tool schema only pins the six top-level keys
+_FUSED_TOOL = {
+    "name": "record_personality_analyses",
+    "description": "Record the analyses for all six personality dimensions.",
+    "input_schema": {
+        "type": "object",
+        "properties": {key: {"type": "object"} for key in _DIMENSION_SPEC},
+        "required": list(_DIMENSION_SPEC),
+    },
+}
+
+
+def _tool_input(message) -> Dict:
+    """Pull the structured payload off the forced tool_use block.
+
+    Falls back to text parsing if the model answered in prose despite
+    the forced tool choice (seen occasionally under heavy truncation).
+    """
+    for block in message.content:
+        if block.type == "tool_use":
+            return block.input
+    return _parse_llm_json(message.content[0].text)
+
+
+# Matches a response wrapped in a single markdown code fence; group 1 is
+# the payload. Compiled once instead of split("```")-ing every response,
+# which allocates a list of every fence segment.
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*\n?(.*?)\n?```\s*$", re.DOTALL)
+
+# Transient statuses worth retrying; anything else fails fast
+_RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+
+async def _call_with_retry(fn, *, max_attempts: int = 5, base: float = 1.0, cap: float = 30.0):
+    """Retry an async API call on rate-limit and transient server errors.
+
+    Exponential backoff with jitter; a Retry-After header, when present,
+    takes precedence over the computed delay. Without this, one 429 in
+    the middle of Pass 1 aborts the whole pipeline and throws away every
+    dimension already extracted.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return await fn()
+        except (anthropic.RateLimitError, anthropic.APIStatusError) as e:
+            status = getattr(e, 'status_code', None)
+            if attempt == max_attempts - 1 or status not in _RETRYABLE_STATUS:
+                raise
+
+            delay = min(cap, base * 2 ** attempt) + random.random()
+            response = getattr(e, 'response', None)
+            if response is not None:
+                retry_after = response.headers.get('retry-after')
+                if retry_after:
+                    try:
+                        delay = float(retry_after)
+                    except ValueError:
+                        pass  # HTTP-date form; keep the computed backoff
+
+            logger.warning("anthropic_call_retrying",
+                          attempt=attempt + 1,
+                          status_code=status,
+                          delay_seconds=delay)
+            await asyncio.sleep(delay)
+
+
+# Sample normalization for the LLM corpus: strip quoted-reply markers and
+# collapse whitespace runs, but keep paragraph breaks - the writing-style
+# prompts analyze rhythm and paragraph structure
+_QUOTE_PREFIX_RE = re.compile(r"^>+ ?", re.MULTILINE)
+_HSPACE_RE = re.compile(r"[ \t]+")
+_VSPACE_RE = re.compile(r"\n{3,}")
+
+
+def _normalize_sample(s: str) -> str:
+    """Drop quote prefixes and squeeze redundant whitespace from a sample"""
+    s = _QUOTE_PREFIX_RE.sub("", s)
+    s = _HSPACE_RE.sub(" ", s)
+    return _VSPACE_RE.sub("\n\n", s).strip()
+
+
+def _char_shingles(s: str, n: int = 5) -> set:
+    """Character n-gram set used for near-duplicate detection"""
+    return {s[i:i + n] for i in range(len(s) - n + 1)}
+
+
+def _dedupe_samples(samples: List[str], threshold: float = 0.85) -> List[str]:
+    """Drop samples near-identical to an already-kept one.
+
+    Jaccard similarity over char 5-shingles; corpora full of signatures,
+    forwarded threads, and boilerplate otherwise ship the same tokens to
+    the model several times over. Sample counts are capped at 50, so the
+    pairwise scan stays cheap.
+    """
+    kept: List[str] = []
+    kept_shingles: List[set] = []
+    for s in samples:
+        shingles = _char_shingles(s)
+        if not shingles:
+            continue
+        if any(
+            len(shingles & prev) / len(shingles | prev) >= threshold
+            for prev in kept_shingles
+        ):
+            continue
+        kept.append(s)
+        kept_shingles.append(shingles)
+    return kept
+
+
+def _parse_llm_json(content: str) -> Dict:
+    """Parse a JSON payload from an LLM response, tolerating markdown fences"""
+    match = _FENCE_RE.match(content)
+    if match:
+        content = match.group(1)
+    # orjson parses several times faster than stdlib json; responses here
+    # can run to tens of KB. It also tolerates surrounding whitespace, so
+    # no extra strip() pass is needed.
+    return orjson.loads(content)
+
 
 class PatternExtractor:
     """Pass 1: Extract patterns for each personality dimension using LLM"""
-    
-    def __init__(self, client: Anthropic, model: str):
+
+    __slots__ = ("client", "model", "cache")
+
+    def __init__(self, client: AsyncAnthropic, model: str, cache: Optional[LLMCache] = None):
         self.client = client
         self.model = model
-    
-    def extract_dimension(
-        self, 
-        dimension: str, 
+        self.cache = cache
+
+    async def extract_dimension(
+        self,
+        dimension: str,
         text_samples: List[str],
         max_tokens: Optional[int] = None
     ) -> Dict:
         """Extract patterns for a single dimension"""
         max_tokens = max_tokens or settings.ANALYSIS_MAX_TOKENS
-        prompt_template = EXTRACTION_PROMPTS.get(dimension)
-        if not prompt_template:
+        instructions = _DIMENSION_INSTRUCTIONS.get(dimension)
+        if not instructions:
             raise ValueError(f"Unknown dimension: {dimension}")
-        
+
         # Combine text samples with separators
         combined_text = "\n\n---\n\n".join(text_samples)
-        prompt = prompt_template.format(text_samples=combined_text)
-        
+
         logger.debug(f"extracting_{dimension}", sample_count=len(text_samples))
-        
+
+        if self.cache:
+            cache_key = LLMCache.make_key(dimension=dimension, model=self.model, corpus=combined_text)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            response = self.client.messages.create(
+            # Invariant corpus first (server-side cached across the six
+            # dimension calls), per-dimension instructions last
+            response = await _call_with_retry(lambda: self.client.messages.create(
                 model=self.model,
                 max_tokens=max_tokens,
-                system="You are an expert psychologist and linguistic analyst. Analyze writing samples to extract deep personality patterns. Always respond with valid JSON only, no markdown.",
-                messages=[{"role": "user", "content": prompt}]
-            )
-            
-            content = response.content[0].text.strip()
-            # Handle potential markdown code blocks
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-                content = content.strip()
-            
-            return json.loads(content)
-            
-        except json.JSONDecodeError as e:
+                system=_EXTRACTION_SYSTEM_PROMPT,
+                messages=[{
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "WRITING SAMPLES:\n" + combined_text,
+                            "cache_control": {"type": "ephemeral"}
+                        },
+                        {"type": "text", "text": instructions}
+                    ]
+                }],
+                tools=[_DIMENSION_TOOLS[dimension]],
+                tool_choice={"type": "tool", "name": _DIMENSION_TOOLS[dimension]["name"]},
+                extra_headers=_PROMPT_CACHING_HEADERS
+            ))
+
+            result = _tool_input(response)
+            if self.cache:
+                self.cache.set(cache_key, result)
+            return result
+
+        except orjson.JSONDecodeError as e:
             logger.error(f"json_parse_error_{dimension}", error=str(e))
             raise ValueError(f"Failed to parse {dimension} analysis: {e}")
         except Exception as e:
             logger.error(f"extraction_error_{dimension}", error=str(e), exc_info=True)
             raise
 
-    def extract_all_dimensions(
-        self, 
+    async def _extract_dimension_timed(self, dimension: str, text_samples: List[str]) -> tuple:
+        """extract_dimension wrapped in its timer, tagged with its name"""
+        with PerformanceTimer(logger, f"extract_{dimension}"):
+            return dimension, await self.extract_dimension(dimension, text_samples)
+
+    async def extract_all_dimensions(
+        self,
         text_samples: List[str],
         progress_callback: Optional[Callable[[str, int, int], None]] = None
     ) -> Dict[str, Dict]:
-        """Extract patterns for all dimensions"""
+        """Extract patterns for all dimensions concurrently.
+
+        Each dimension is an independent API call, so firing them in
+        parallel bounds Pass-1 wall time by the slowest call instead of
+        the sum of all of them - no worker threads needed now that the
+        client is async.
+        """
         results = {}
-        dimensions = list(EXTRACTION_PROMPTS.keys())
-        total = len(dimensions)
-        
-        for i, dimension in enumerate(dimensions):
+        total = len(_DIMENSIONS)
+
+        tasks = [
+            asyncio.ensure_future(self._extract_dimension_timed(dimension, text_samples))
+            for dimension in _DIMENSIONS
+        ]
+        for done, task in enumerate(asyncio.as_completed(tasks), start=1):
+            dimension, result = await task
+            results[dimension] = result
+
+            if progress_callback:
+                progress_callback(DIMENSION_NAMES[dimension], done, total)
+
+            logger.info("dimension_extracted",
+                       dimension=dimension,
+                       confidence=result.get("confidence", 0))
+
+        return results
+
+    async def extract_all_dimensions_batch(
+        self,
+        text_samples: List[str],
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        poll_interval: float = 2.0
+    ) -> Dict[str, Dict]:
+        """Extract all dimensions via the Message Batches API.
+
+        Batched requests cost half as much as synchronous ones and share
+        one submission round trip across the six dimension prompts. The
+        trade-off is polling latency, so this path suits background
+        re-analysis; interactive runs use extract_all_dimensions.
+        """
+        total = len(_DIMENSIONS)
+        combined_text = "\n\n---\n\n".join(text_samples)
+
+        requests = [
+            {
+                "custom_id": dimension,
+                "params": {
+                    "model": self.model,
+                    "max_tokens": settings.ANALYSIS_MAX_TOKENS,
+                    "system": _EXTRACTION_SYSTEM_PROMPT,
+                    "messages": [{
+                        "role": "user",
+                        "content": combined_text.join(_BATCH_PROMPT_PARTS[dimension])
+                    }],
+                    "tools": [_DIMENSION_TOOLS[dimension]],
+                    "tool_choice": {"type": "tool", "name": _DIMENSION_TOOLS[dimension]["name"]}
+                }
+            }
+            for dimension in _DIMENSIONS
+        ]
+
+        batch = await self.client.beta.messages.batches.create(requests=requests)
+        logger.info("extraction_batch_submitted", batch_id=batch.id, request_count=total)
+
+        # Poll with exponential backoff - batch turnaround is minutes, so
+        # hammering retrieve() buys nothing
+        delay = poll_interval
+        while batch.processing_status != "ended":
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60.0)
+            batch = await self.client.beta.messages.batches.retrieve(batch.id)
+
+        results = {}
+        async for entry in await self.client.beta.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                logger.error("batch_extraction_failed",
+                            dimension=entry.custom_id,
+                            result_type=entry.result.type)
+                raise ValueError(f"Batch extraction failed for {entry.custom_id}: {entry.result.type}")
+
+            results[entry.custom_id] = _tool_input(entry.result.message)
+
             if progress_callback:
-                progress_callback(DIMENSION_NAMES[dimension], i + 1, total)
-            
-            with PerformanceTimer(logger, f"extract_{dimension}"):
-                results[dimension] = self.extract_dimension(dimension, text_samples)
-            
-            logger.info(f"dimension_extracted", 
-                       dimension=dimension, 
+                progress_callback(DIMENSION_NAMES[entry.custom_id], len(results), total)
+
+            logger.info("dimension_extracted",
+                       dimension=entry.custom_id,
+                       confidence=results[entry.custom_id].get("confidence", 0))
+
+        return results
+
+    async def extract_all_dimensions_fused(
+        self,
+        text_samples: List[str],
+        progress_callback: Optional[Callable[[str, int, int], None]] = None
+    ) -> Dict[str, Dict]:
+        """Extract all six dimensions with a single fused prompt.
+
+        The corpus dominates each per-dimension prompt, so sending it once
+        with all six instruction blocks cuts prompt tokens ~6x and
+        collapses six round trips into one. Any dimensions missing from
+        the fused response are backfilled with per-dimension calls.
+        """
+        total = len(_DIMENSIONS)
+        combined_text = "\n\n---\n\n".join(text_samples)
+        prompt = combined_text.join(_FUSED_PROMPT_PARTS)
+
+        if progress_callback:
+            progress_callback("Extracting all dimensions", 1, total)
+
+        with PerformanceTimer(logger, "extract_fused", sample_count=len(text_samples)):
+            response = await _call_with_retry(lambda: self.client.messages.create(
+                model=self.model,
+                max_tokens=settings.ANALYSIS_MAX_TOKENS * total,
+                system=_EXTRACTION_SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": prompt}],
+                tools=[_FUSED_TOOL],
+                tool_choice={"type": "tool", "name": _FUSED_TOOL["name"]}
+            ))
+
+        try:
+            results = _tool_input(response)
+        except orjson.JSONDecodeError as e:
+            logger.error("fused_extraction_parse_error", error=str(e))
+            raise ValueError(f"Failed to parse fused extraction: {e}")
+
+        missing = [d for d in _DIMENSIONS if d not in results]
+        if missing:
+            logger.warning("fused_extraction_incomplete", missing=missing)
+            for dimension in missing:
+                results[dimension] = await self.extract_dimension(dimension, text_samples)
+
+        for dimension in _DIMENSIONS:
+            logger.info("dimension_extracted",
+                       dimension=dimension,
                        confidence=results[dimension].get("confidence", 0))
-        
+
         return results
 
 
 class ProfileSynthesizer:
     """Pass 2: Synthesize raw patterns into coherent personality profile"""
-    
-    def __init__(self, client: Anthropic, model: str):
+
+    __slots__ = ("client", "model", "cache")
+
+    def __init__(self, client: AsyncAnthropic, model: str, cache: Optional[LLMCache] = None):
         self.client = client
         self.model = model
-    
-    def synthesize(self, raw_analyses: Dict[str, Dict]) -> Dict:
+        self.cache = cache
+
+    async def synthesize(self, raw_analyses: Dict[str, Dict]) -> Dict:
         """Synthesize all dimension analyses into a coherent profile"""
-        formatted_analyses = json.dumps(raw_analyses, indent=2)
-        prompt = SYNTHESIS_PROMPT.format(raw_analyses=formatted_analyses)
-        
-        logger.info("synthesizing_profile")
-        
-        try:
-            response = self.client.messages.create(
+        # Compact serialization: indentation whitespace is ~30% of the
+        # Pass-2 input tokens and carries no signal for the model.
+        # Serialized off the event loop - the payload can run to hundreds
+        # of kilobytes and the server keeps handling requests meanwhile
+        formatted_analyses = (await asyncio.to_thread(orjson.dumps, raw_analyses)).decode()
+        prompt = formatted_analyses.join(_SYNTHESIS_PROMPT_PARTS)
+
+        logger.info("synthesizing_profile", payload_bytes=len(formatted_analyses))
+
+        if self.cache:
+            cache_key = LLMCache.make_key(model=self.model, raw_analyses=formatted_analyses)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Stream the response: chunks accumulate while the model is still
+        # generating instead of waiting on the fully assembled message, so
+        # the final parse starts the moment the last token lands
+        async def _stream_synthesis():
+            async with self.client.messages.stream(
                 model=self.model,
                 max_tokens=2000,
-                system="You are synthesizing a comprehensive personality profile. Be insightful and specific. Respond with valid JSON only.",
-                messages=[{"role": "user", "content": prompt}]
-            )
-            
-            content = response.content[0].text.strip()
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-                content = content.strip()
-            
-            return json.loads(content)
-            
-        except json.JSONDecodeError as e:
+                system="You are synthesizing a comprehensive personality profile. Be insightful and specific.",
+                messages=[{"role": "user", "content": prompt}],
+                tools=[_SYNTHESIS_TOOL],
+                tool_choice={"type": "tool", "name": _SYNTHESIS_TOOL["name"]}
+            ) as stream:
+                return await stream.get_final_message()
+
+        try:
+            result = _tool_input(await _call_with_retry(_stream_synthesis))
+            if self.cache:
+                self.cache.set(cache_key, result)
+            return result
+
+        except orjson.JSONDecodeError as e:
             logger.error("synthesis_json_error", error=str(e))
             raise ValueError(f"Failed to parse synthesis: {e}")
         except Exception as e:
@@ -138,193 +653,93 @@ class ProfileSynthesizer:
             raise
     
     def build_profile(
-        self, 
-        raw_analyses: Dict[str, Dict], 
+        self,
+        raw_analyses: Dict[str, Dict],
         synthesis: Dict,
         metadata: AnalysisMetadata
     ) -> PersonalityProfile:
-        """Build the final PersonalityProfile from raw data and synthesis"""
-        
-        # Build WritingStyleProfile
-        ws = raw_analyses.get("writing_style", {})
-        writing_style = WritingStyleProfile(
-            rhythm=RhythmPattern(**ws.get("rhythm", {
-                "pacing_description": "Unable to determine",
-                "sentence_variation": "Unknown",
-                "paragraph_style": "Unknown",
-                "flow_characteristics": []
-            })),
-            stylistic_markers=StylisticMarkers(**ws.get("stylistic_markers", {
-                "signature_phrases": [],
-                "metaphor_patterns": [],
-                "transition_style": "Unknown",
-                "emphasis_patterns": [],
-                "punctuation_habits": "Standard"
-            })),
-            tonal_range=TonalRange(**ws.get("tonal_range", {
-                "default_tone": "Neutral",
-                "tonal_shifts": {},
-                "emotional_coloring": "Unknown",
-                "formality_spectrum": "Unknown"
-            })),
-            linguistic_fingerprints=ws.get("linguistic_fingerprints", []),
-            vocabulary_character=ws.get("vocabulary_character", "Unknown"),
-            voice_description=ws.get("voice_description", "Unable to determine writing voice"),
-            confidence=ws.get("confidence", 0.5)
-        )
-        
-        # Build CognitiveProfile
-        cog = raw_analyses.get("cognitive", {})
-        cognitive = CognitiveProfile(
-            reasoning_patterns=ReasoningPatterns(**cog.get("reasoning_patterns", {
-                "primary_mode": "Mixed",
-                "logical_style": "Unknown",
-                "evidence_preference": "Unknown",
-                "abstraction_level": "Unknown"
-            })),
-            mental_models=MentalModels(**cog.get("mental_models", {
-                "identified_frameworks": [],
-                "implicit_models": [],
-                "analogical_sources": []
-            })),
-            problem_solving_style=cog.get("problem_solving_style", "Unknown"),
-            idea_connection_style=cog.get("idea_connection_style", "Unknown"),
-            learning_approach=cog.get("learning_approach", "Unknown"),
-            complexity_preference=cog.get("complexity_preference", "Unknown"),
-            thinking_description=cog.get("thinking_description", "Unable to determine thinking patterns"),
-            confidence=cog.get("confidence", 0.5)
-        )
-        
-        # Build EmotionalProfile
-        emo = raw_analyses.get("emotional", {})
-        emotional = EmotionalProfile(
-            triggers=EmotionalTriggers(**emo.get("triggers", {
-                "excites": [],
-                "frustrates": [],
-                "motivates": [],
-                "calms": []
-            })),
-            passion_map=PassionMap(**emo.get("passion_map", {
-                "high_passion": [],
-                "moderate_interest": [],
-                "emerging_curiosity": []
-            })),
-            expression_patterns=emo.get("expression_patterns", "Unknown"),
-            emotional_vocabulary=emo.get("emotional_vocabulary", []),
-            values_from_emotion=emo.get("values_from_emotion", []),
-            emotional_baseline=emo.get("emotional_baseline", "Unknown"),
-            emotional_description=emo.get("emotional_description", "Unable to determine emotional patterns"),
-            confidence=emo.get("confidence", 0.5)
-        )
-        
-        # Build InterestProfile
-        int_data = raw_analyses.get("interests", {})
-        genuine_interests = [
-            Interest(**i) if isinstance(i, dict) else Interest(
-                topic=str(i), depth=0.5, evidence=[], context="Unknown"
-            )
-            for i in int_data.get("genuine_interests", [])
-        ]
-        interests = InterestProfile(
-            genuine_interests=genuine_interests,
-            curiosities=int_data.get("curiosities", []),
-            aspirations=int_data.get("aspirations", []),
-            topic_affinities=int_data.get("topic_affinities", {}),
-            learning_trajectories=int_data.get("learning_trajectories", []),
-            interest_description=int_data.get("interest_description", "Unable to determine interests"),
-            confidence=int_data.get("confidence", 0.5)
-        )
-        
-        # Build WorldviewProfile
-        wv = raw_analyses.get("worldview", {})
-        worldview = WorldviewProfile(
-            core_beliefs=CoreBeliefs(**wv.get("core_beliefs", {
-                "explicit_beliefs": [],
-                "implicit_assumptions": [],
-                "values_hierarchy": []
-            })),
-            philosophical_leanings=wv.get("philosophical_leanings", []),
-            framing_patterns=wv.get("framing_patterns", "Unknown"),
-            unique_perspectives=wv.get("unique_perspectives", []),
-            domain_lenses=wv.get("domain_lenses", {}),
-            epistemology=wv.get("epistemology", "Unknown"),
-            worldview_description=wv.get("worldview_description", "Unable to determine worldview"),
-            confidence=wv.get("confidence", 0.5)
-        )
-        
-        # Build SocialProfile
-        soc = raw_analyses.get("social", {})
-        social = SocialProfile(
-            communication_dynamics=CommunicationDynamics(**soc.get("communication_dynamics", {
-                "initiation_style": "Unknown",
-                "response_patterns": "Unknown",
-                "engagement_depth": "Unknown",
-                "directness_level": "Unknown"
-            })),
-            collaboration_style=soc.get("collaboration_style", "Unknown"),
-            authority_positioning=soc.get("authority_positioning", "Unknown"),
-            audience_adaptation=soc.get("audience_adaptation", {}),
-            relational_patterns=soc.get("relational_patterns", []),
-            conflict_approach=soc.get("conflict_approach", "Unknown"),
-            social_description=soc.get("social_description", "Unable to determine social patterns"),
-            confidence=soc.get("confidence", 0.5)
-        )
-        
-        # Calculate overall confidence
-        confidences = [
-            writing_style.confidence,
-            cognitive.confidence,
-            emotional.confidence,
-            interests.confidence,
-            worldview.confidence,
-            social.confidence
-        ]
+        """Build the final PersonalityProfile from raw data and synthesis.
+
+        Driven by _DIMENSION_SPEC rather than six hand-written blocks; each
+        dimension is constructed by the same generic loop over its spec.
+        """
+        # Interests need light coercion: bare-string entries become
+        # minimal Interest dicts before validation
+        raw_interests = raw_analyses.get("interests", {})
+        if raw_interests.get("genuine_interests"):
+            raw_interests = {
+                **raw_interests,
+                "genuine_interests": [
+                    i if isinstance(i, dict) else {
+                        "topic": str(i), "depth": 0.5, "evidence": [], "context": "Unknown"
+                    }
+                    for i in raw_interests["genuine_interests"]
+                ]
+            }
+
+        dimensions = {}
+        for key, (cls, sub_specs, defaults) in _DIMENSION_SPEC.items():
+            raw = raw_interests if key == "interests" else raw_analyses.get(key, {})
+            dimensions[key] = _build_dimension(raw, cls, sub_specs, defaults)
+
+        # One pass over the confidences: mean for the headline number,
+        # min so callers can gate on the weakest dimension without
+        # re-scanning the profile
+        confidences = [d.confidence for d in dimensions.values()]
         overall_confidence = sum(confidences) / len(confidences)
-        
-        return PersonalityProfile(
+        min_confidence = min(confidences)
+
+        # model_construct: every field here is either a sub-model already
+        # validated at the LLM boundary above, a locally computed float,
+        # or synthesis output whose shape the forced tool schema pins -
+        # re-running the full tree validation would only repeat work
+        return PersonalityProfile.model_construct(
             version=2,
-            writing_style=writing_style,
-            cognitive=cognitive,
-            emotional=emotional,
-            interests=interests,
-            worldview=worldview,
-            social=social,
             personality_essence=synthesis.get("personality_essence", "Unable to synthesize personality essence"),
-            key_characteristics=synthesis.get("key_characteristics", []),
+            key_characteristics=tuple(synthesis.get("key_characteristics", ())),
             context_variations=synthesis.get("context_variations", {}),
             analysis_metadata=metadata,
-            overall_confidence=overall_confidence
+            overall_confidence=overall_confidence,
+            min_confidence=min_confidence,
+            **dimensions
         )
 
 
 class AnalysisOrchestrator:
     """Orchestrates the multi-pass personality analysis pipeline"""
-    
+
+    __slots__ = ("model", "batch_size", "client", "cache", "extractor", "synthesizer")
+
     def __init__(
         self, 
         model: Optional[str] = None,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        cache: Optional[LLMCache] = None
     ):
         self.model = model or settings.ANTHROPIC_ANALYSIS_MODEL
         self.batch_size = batch_size or settings.ANALYSIS_BATCH_SIZE
         if not settings.ANTHROPIC_API_KEY or not settings.ANTHROPIC_API_KEY.strip():
             raise ValueError("ANTHROPIC_API_KEY not set. Add it to your .env file.")
-        self.client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
-        self.extractor = PatternExtractor(self.client, self.model)
-        self.synthesizer = ProfileSynthesizer(self.client, self.model)
+        self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+        self.cache = cache if cache is not None else LLMCache()
+        self.extractor = PatternExtractor(self.client, self.model, cache=self.cache)
+        self.synthesizer = ProfileSynthesizer(self.client, self.model, cache=self.cache)
     
-    def analyze(
-        self, 
+    async def analyze(
+        self,
         texts: List[str],
-        progress_callback: Optional[Callable[[str, int, int], None]] = None
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        refresh: bool = False
     ) -> PersonalityProfile:
         """
         Run complete personality analysis pipeline.
-        
+
         Args:
             texts: List of text samples to analyze
             progress_callback: Optional callback(stage_name, current, total)
-        
+            refresh: Re-run Pass 1 even if raw analyses for this corpus
+                are already persisted on disk
+
         Returns:
             Complete PersonalityProfile
         """
@@ -332,7 +747,7 @@ class AnalysisOrchestrator:
             raise ValueError("Cannot analyze empty text list")
         
         start_time = time.time()
-        total_chars = sum(len(t) for t in texts)
+        total_chars = sum(map(len, texts))  # map(len, ...) runs the loop in C
         estimated_tokens = total_chars // 4  # Rough estimate
         
         logger.info("analysis_started", 
@@ -343,22 +758,50 @@ class AnalysisOrchestrator:
         # Batch texts if needed for very large datasets
         sample_texts = self._select_representative_samples(texts)
         
-        # Pass 1: Extract patterns for each dimension
+        # Pass 1: Extract patterns for each dimension. Raw analyses are
+        # persisted on disk keyed by (model, corpus hash) so re-running
+        # synthesis over an unchanged corpus skips extraction entirely.
         if progress_callback:
             progress_callback("Starting pattern extraction", 0, 8)
-        
-        with PerformanceTimer(logger, "pass1_extraction", sample_count=len(sample_texts)):
-            raw_analyses = self.extractor.extract_all_dimensions(
-                sample_texts, 
-                progress_callback
-            )
-        
+
+        raw_path = self._raw_analyses_path(sample_texts)
+        raw_analyses = None
+        if not refresh and raw_path.exists():
+            try:
+                raw_analyses = orjson.loads(raw_path.read_bytes())
+                logger.info("raw_analyses_loaded", path=str(raw_path))
+            except (OSError, orjson.JSONDecodeError) as e:
+                logger.warning("raw_analyses_load_failed", path=str(raw_path), error=str(e))
+
+        if raw_analyses is None:
+            with PerformanceTimer(logger, "pass1_extraction", sample_count=len(sample_texts)):
+                if settings.USE_BATCH_API:
+                    raw_analyses = await self.extractor.extract_all_dimensions_batch(
+                        sample_texts,
+                        progress_callback
+                    )
+                elif settings.USE_FUSED_EXTRACTION:
+                    raw_analyses = await self.extractor.extract_all_dimensions_fused(
+                        sample_texts,
+                        progress_callback
+                    )
+                else:
+                    raw_analyses = await self.extractor.extract_all_dimensions(
+                        sample_texts,
+                        progress_callback
+                    )
+            try:
+                raw_path.parent.mkdir(parents=True, exist_ok=True)
+                raw_path.write_bytes(orjson.dumps(raw_analyses))
+            except OSError as e:
+                logger.warning("raw_analyses_persist_failed", path=str(raw_path), error=str(e))
+
         # Pass 2: Synthesize into coherent profile
         if progress_callback:
             progress_callback("Synthesizing personality profile", 7, 8)
         
         with PerformanceTimer(logger, "pass2_synthesis"):
-            synthesis = self.synthesizer.synthesize(raw_analyses)
+            synthesis = await self.synthesizer.synthesize(raw_analyses)
         
         # Build final profile
         duration = time.time() - start_time
@@ -389,27 +832,72 @@ class AnalysisOrchestrator:
         """
         Select representative samples from texts.
         Prioritizes diversity and quality over quantity.
+
+        Texts are truncated before the emptiness check so we never
+        allocate a stripped copy of a full-length (possibly 100KB+) text,
+        and the strided branch touches only max_samples entries instead
+        of walking the whole list.
         """
         if len(texts) <= max_samples:
-            return [t[:max_chars_per_sample] for t in texts if t.strip()]
-        
-        # Simple sampling: take evenly spaced samples
-        step = len(texts) // max_samples
+            candidates = (t[:max_chars_per_sample] for t in texts)
+        else:
+            # Simple sampling: take evenly spaced samples
+            indices = range(0, len(texts), max(1, len(texts) // max_samples))
+            candidates = (texts[i][:max_chars_per_sample] for i in islice(indices, max_samples))
+
         samples = []
-        for i in range(0, len(texts), step):
-            if len(samples) >= max_samples:
-                break
-            text = texts[i].strip()
-            if text:
-                samples.append(text[:max_chars_per_sample])
-        
-        logger.debug("samples_selected", 
-                    original_count=len(texts), 
-                    selected_count=len(samples))
-        
+        original_bytes = 0
+        for s in candidates:
+            if not s or s.isspace():
+                continue
+            original_bytes += len(s)
+            samples.append(_normalize_sample(s))
+
+        samples = _dedupe_samples(samples)
+        sent_bytes = sum(map(len, samples))
+
+        logger.info("samples_selected",
+                   original_count=len(texts),
+                   selected_count=len(samples),
+                   original_bytes=original_bytes,
+                   sent_bytes=sent_bytes)
+
         return samples
-    
-    def analyze_incrementally(
+
+    def _raw_analyses_path(self, sample_texts: List[str]) -> Path:
+        """Disk location for persisted Pass-1 output.
+
+        Keyed on (model, corpus hash): any change to the selected samples
+        or the model produces a different file, so stale analyses are
+        never reused silently.
+        """
+        corpus_hash = hashlib.sha256(
+            b"\0".join(t.encode() for t in sample_texts)
+        ).hexdigest()
+        return Path.home() / ".cache" / "personify" / "raw" / f"{self.model}_{corpus_hash}.json"
+
+    def analyze_sync(
+        self,
+        texts: List[str],
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        refresh: bool = False
+    ) -> PersonalityProfile:
+        """Synchronous bridge for callers outside an event loop.
+
+        If invoked from inside a running loop (e.g. a sync helper called
+        by an async endpoint), the coroutine runs on a private loop in a
+        worker thread so neither loop is blocked illegally.
+        """
+        coro = self.analyze(texts, progress_callback, refresh=refresh)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    async def analyze_incrementally(
         self,
         texts: List[str],
         existing_profile: Optional[PersonalityProfile] = None,
@@ -420,12 +908,22 @@ class AnalysisOrchestrator:
         For now, this just runs fresh analysis. Future: blend with existing.
         """
         # TODO: Implement incremental analysis that blends new insights with existing profile
-        return self.analyze(texts, progress_callback)
+        return await self.analyze(texts, progress_callback)
+
+
+# Only loop-independent state is shared across convenience calls: the
+# orchestrator's AsyncAnthropic client pools connections bound to the
+# event loop they were opened on, and analyze_sync runs each call on a
+# fresh asyncio.run loop, so a memoized orchestrator would reuse
+# connections from a closed loop on the second call. The LLM response
+# cache has no loop affinity, so it persists.
+@lru_cache(maxsize=1)
+def _get_shared_cache() -> LLMCache:
+    return LLMCache()
 
 
 # Convenience function for simple usage
 def analyze_personality(texts: List[str]) -> PersonalityProfile:
     """Analyze texts and return a PersonalityProfile"""
-    orchestrator = AnalysisOrchestrator()
-    return orchestrator.analyze(texts)
+    return AnalysisOrchestrator(cache=_get_shared_cache()).analyze_sync(texts)
 
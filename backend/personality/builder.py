@@ -1,13 +1,32 @@
+import hashlib
+
+import orjson
 from sqlalchemy.orm import Session
-from typing import List, Optional, Callable
+from typing import Dict, List, Optional, Callable
 
-from backend.database.models import Document, PersonalityProfile as DBPersonalityProfile
+from backend.database.models import Chunk, Document, PersonalityProfile as DBPersonalityProfile
 from backend.personality.ai_analyzer import AnalysisOrchestrator
 from backend.personality.profile import PersonalityProfile
 from backend.logging_config import get_logger, PerformanceTimer
 
 logger = get_logger(__name__)
 
+# Validated profiles cached by row id. Profile rows are immutable (a new
+# version is always a new row), so the id fully identifies the content
+# and re-validating the nested pydantic tree on every chat request is
+# pure repeat work.
+_profile_cache: Dict[int, PersonalityProfile] = {}
+
+
+def _validated_profile(db_profile: DBPersonalityProfile) -> PersonalityProfile:
+    """Validate a profile row once and reuse the instance thereafter"""
+    cached = _profile_cache.get(db_profile.id)
+    if cached is None:
+        if len(_profile_cache) >= 8:
+            _profile_cache.clear()
+        cached = _profile_cache[db_profile.id] = PersonalityProfile(**db_profile.profile_data)
+    return cached
+
 
 class PersonalityProfileManager:
     """Manage personality profile creation and updates using AI-powered analysis"""
@@ -20,34 +39,59 @@ class PersonalityProfileManager:
         """Create personality profile from all documents using AI analysis"""
         logger.info("personality_profile_creation_started")
         
-        # Get all processed documents
-        documents = db.query(Document).filter(
+        document_count = db.query(Document.id).filter(
             Document.processed_at.isnot(None)
-        ).all()
-        
-        if not documents:
+        ).count()
+
+        if not document_count:
             logger.warning("no_processed_documents_for_profile")
             raise ValueError("No processed documents found. Upload and process data first.")
-        
-        logger.info("documents_retrieved_for_profile", document_count=len(documents))
-        
-        # Extract text from document chunks
-        texts = []
-        for doc in documents:
-            for chunk in doc.chunks:
-                if chunk.content and chunk.content.strip():
-                    texts.append(chunk.content)
-        
+
+        logger.info("documents_retrieved_for_profile", document_count=document_count)
+
+        # Stream chunk text straight from the chunks table: one column
+        # query joined to processed documents replaces materializing every
+        # Document and Chunk ORM object, and yield_per keeps the server-
+        # side result window bounded while the plain-string list is built
+        texts = [
+            content
+            for (content,) in db.query(Chunk.content)
+            .join(Document)
+            .filter(Document.processed_at.isnot(None), Chunk.content.isnot(None))
+            .order_by(Chunk.id)
+            .yield_per(1000)
+            if content.strip()
+        ]
+
         if not texts:
             raise ValueError("No text content found in documents")
-        
+
         logger.info("text_extracted_for_profile", text_count=len(texts))
-        
+
+        # Skip the whole analysis when the corpus is unchanged: the
+        # signature hashes chunk content in stable (chunk id) order, so a
+        # refresh over the same documents returns the active profile
+        # without a single LLM call
+        signature = hashlib.sha256()
+        for text in texts:
+            signature.update(text.encode())
+            signature.update(b"\0")
+        content_signature = signature.hexdigest()
+
+        active = db.query(DBPersonalityProfile).filter(
+            DBPersonalityProfile.is_active == True
+        ).first()
+        if active and active.content_signature == content_signature:
+            logger.info("personality_profile_unchanged",
+                       profile_id=active.id,
+                       version=active.version)
+            return _validated_profile(active)
+
         # Run AI-powered analysis
         orchestrator = AnalysisOrchestrator()
         
         with PerformanceTimer(logger, "ai_personality_analysis", text_count=len(texts)):
-            profile = orchestrator.analyze(texts, progress_callback)
+            profile = orchestrator.analyze_sync(texts, progress_callback)
         
         logger.info("personality_profile_analyzed", 
                    version=profile.version,
@@ -55,16 +99,23 @@ class PersonalityProfileManager:
         
         # Save to database
         try:
+            # model_dump_json serializes in pydantic's Rust core; the
+            # orjson round-trip back to a dict is far cheaper than
+            # model_dump's Python-level tree walk
             db_profile = DBPersonalityProfile(
                 version=profile.version,
-                profile_data=profile.model_dump(),
+                profile_data=orjson.loads(profile.model_dump_json()),
+                content_signature=content_signature,
                 is_active=True
             )
-            
-            # Deactivate old profiles
-            old_count = db.query(DBPersonalityProfile).update({'is_active': False})
+
+            # Deactivate the active profile - the filter hits the partial
+            # index, so this updates one row instead of the whole table
+            old_count = db.query(DBPersonalityProfile).filter(
+                DBPersonalityProfile.is_active == True
+            ).update({'is_active': False}, synchronize_session=False)
             logger.debug("old_profiles_deactivated", count=old_count)
-            
+
             db.add(db_profile)
             db.commit()
             db.refresh(db_profile)
@@ -92,11 +143,11 @@ class PersonalityProfileManager:
             logger.warning("no_active_personality_profile_found")
             raise ValueError("No active personality profile found. Create one first.")
         
-        logger.debug("active_personality_profile_retrieved", 
-                    profile_id=db_profile.id, 
+        logger.debug("active_personality_profile_retrieved",
+                    profile_id=db_profile.id,
                     version=db_profile.version)
-        
-        return PersonalityProfile(**db_profile.profile_data)
+
+        return _validated_profile(db_profile)
     
     @staticmethod
     def update_profile(db: Session, profile: PersonalityProfile) -> PersonalityProfile:
@@ -104,15 +155,18 @@ class PersonalityProfileManager:
         logger.info("personality_profile_update_started", current_version=profile.version)
         
         try:
-            # Deactivate old profiles
-            old_count = db.query(DBPersonalityProfile).update({'is_active': False})
+            # Deactivate the active profile - the filter hits the partial
+            # index, so this updates one row instead of the whole table
+            old_count = db.query(DBPersonalityProfile).filter(
+                DBPersonalityProfile.is_active == True
+            ).update({'is_active': False}, synchronize_session=False)
             logger.debug("old_profiles_deactivated", count=old_count)
-            
+
             # Create new version
             new_version = profile.version + 1
             db_profile = DBPersonalityProfile(
                 version=new_version,
-                profile_data=profile.model_dump(),
+                profile_data=orjson.loads(profile.model_dump_json()),
                 is_active=True
             )
             
@@ -120,11 +174,11 @@ class PersonalityProfileManager:
             db.commit()
             db.refresh(db_profile)
             
-            logger.info("personality_profile_updated", 
-                       old_version=profile.version, 
+            logger.info("personality_profile_updated",
+                       old_version=profile.version,
                        new_version=new_version)
-            
-            return PersonalityProfile(**db_profile.profile_data)
+
+            return _validated_profile(db_profile)
         except Exception as e:
             logger.error("personality_profile_update_failed", error=str(e), exc_info=True)
             db.rollback()
@@ -0,0 +1,111 @@
+"""
+Response cache for LLM analysis calls.
+
+Analysis prompts are deterministic functions of (dimension, model, prompt
+text), so re-running analysis on an unchanged corpus can reuse the parsed
+JSON instead of paying the API call again - common during development and
+on retries after a downstream failure.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Protocol, Tuple
+
+from backend.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Storage interface for cached LLM responses"""
+
+    def get(self, key: str) -> Optional[Tuple[float, Dict]]:
+        """Return (expires_at, value) or None"""
+        ...
+
+    def set(self, key: str, expires_at: float, value: Dict) -> None:
+        ...
+
+
+class MemoryBackend:
+    """
+    In-process dict backend bounded to the most recently used entries.
+
+    Cached values are full parsed dimension analyses, so an unbounded
+    store could grow without limit in a long-lived server process; a
+    small window is plenty since reuse is dominated by the current
+    corpus.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self._store: Dict[str, Tuple[float, Dict]] = {}
+        self._max_entries = max_entries
+
+    def get(self, key: str) -> Optional[Tuple[float, Dict]]:
+        entry = self._store.get(key)
+        if entry is not None:
+            # Refresh recency (dicts keep insertion order) so hot keys
+            # survive eviction
+            self._store[key] = self._store.pop(key)
+        return entry
+
+    def set(self, key: str, expires_at: float, value: Dict) -> None:
+        self._store.pop(key, None)
+        self._store[key] = (expires_at, value)
+        while len(self._store) > self._max_entries:
+            del self._store[next(iter(self._store))]
+
+
+class FileBackend:
+    """File-per-entry backend - survives process restarts"""
+
+    def __init__(self, cache_dir: str):
+        self._dir = Path(cache_dir)
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Tuple[float, Dict]]:
+        path = self._dir / f"{key}.json"
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            return entry['expires_at'], entry['value']
+        except (OSError, json.JSONDecodeError, KeyError):
+            return None
+
+    def set(self, key: str, expires_at: float, value: Dict) -> None:
+        path = self._dir / f"{key}.json"
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'expires_at': expires_at, 'value': value}, f)
+
+
+class LLMCache:
+    """TTL cache for parsed LLM JSON responses"""
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl_seconds: float = 7 * 24 * 3600):
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttl_seconds = ttl_seconds
+        self.stats = {'hits': 0, 'misses': 0}
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Stable key from the parts that determine the response"""
+        serialized = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        entry = self.backend.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.time():
+                self.stats['hits'] += 1
+                logger.info("llm_cache_hit", key=key[:12], **self.stats)
+                return value
+
+        self.stats['misses'] += 1
+        logger.debug("llm_cache_miss", key=key[:12])
+        return None
+
+    def set(self, key: str, value: Dict) -> None:
+        self.backend.set(key, time.time() + self.ttl_seconds, value)
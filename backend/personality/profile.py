@@ -1,29 +1,44 @@
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional
+import io
+from itertools import islice
+
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Dict, Optional, Tuple
+
+
+class _FrozenModel(BaseModel):
+    """Shared base: profile models are immutable once built.
+
+    Freezing skips the per-attribute validation machinery on assignment
+    attempts, lets pydantic generate __hash__, and documents the
+    invariant the caching layers (validated-instance cache, rendered
+    prompt text) already depend on.
+    """
+    model_config = {"frozen": True}
+
 
 
 # ============================================================================
 # Writing Style Profile
 # ============================================================================
 
-class RhythmPattern(BaseModel):
+class RhythmPattern(_FrozenModel):
     """Captures writing rhythm and pacing patterns"""
     pacing_description: str = Field(description="Natural language description of writing pace")
     sentence_variation: str = Field(description="How sentence length varies - uniform, varied, rhythmic")
     paragraph_style: str = Field(description="Paragraph organization patterns")
-    flow_characteristics: List[str] = Field(default_factory=list, description="Key flow traits")
+    flow_characteristics: Tuple[str, ...] = Field(default_factory=tuple, description="Key flow traits")
 
 
-class StylisticMarkers(BaseModel):
+class StylisticMarkers(_FrozenModel):
     """Unique stylistic fingerprints"""
-    signature_phrases: List[str] = Field(default_factory=list, description="Distinctive recurring phrases")
-    metaphor_patterns: List[str] = Field(default_factory=list, description="Types of metaphors used")
+    signature_phrases: Tuple[str, ...] = Field(default_factory=tuple, description="Distinctive recurring phrases")
+    metaphor_patterns: Tuple[str, ...] = Field(default_factory=tuple, description="Types of metaphors used")
     transition_style: str = Field(description="How ideas are bridged")
-    emphasis_patterns: List[str] = Field(default_factory=list, description="How emphasis is conveyed")
+    emphasis_patterns: Tuple[str, ...] = Field(default_factory=tuple, description="How emphasis is conveyed")
     punctuation_habits: str = Field(description="Notable punctuation patterns")
 
 
-class TonalRange(BaseModel):
+class TonalRange(_FrozenModel):
     """Tonal characteristics across contexts"""
     default_tone: str = Field(description="Primary tonal quality")
     tonal_shifts: Dict[str, str] = Field(default_factory=dict, description="Tone changes by context")
@@ -31,12 +46,12 @@ class TonalRange(BaseModel):
     formality_spectrum: str = Field(description="Range and default formality level")
 
 
-class WritingStyleProfile(BaseModel):
+class WritingStyleProfile(_FrozenModel):
     """Complete writing style analysis"""
     rhythm: RhythmPattern
     stylistic_markers: StylisticMarkers
     tonal_range: TonalRange
-    linguistic_fingerprints: List[str] = Field(default_factory=list, description="Unique language patterns")
+    linguistic_fingerprints: Tuple[str, ...] = Field(default_factory=tuple, description="Unique language patterns")
     vocabulary_character: str = Field(description="Vocabulary sophistication and character")
     voice_description: str = Field(description="Natural language summary of writing voice")
     confidence: float = Field(ge=0, le=1, description="Confidence in this analysis")
@@ -46,7 +61,7 @@ class WritingStyleProfile(BaseModel):
 # Cognitive Profile
 # ============================================================================
 
-class ReasoningPatterns(BaseModel):
+class ReasoningPatterns(_FrozenModel):
     """How reasoning is structured"""
     primary_mode: str = Field(description="Deductive, inductive, abductive, or mixed")
     logical_style: str = Field(description="Linear, associative, dialectical")
@@ -54,14 +69,14 @@ class ReasoningPatterns(BaseModel):
     abstraction_level: str = Field(description="Concrete to abstract thinking preference")
 
 
-class MentalModels(BaseModel):
+class MentalModels(_FrozenModel):
     """Mental frameworks used"""
-    identified_frameworks: List[str] = Field(default_factory=list, description="Named frameworks referenced")
-    implicit_models: List[str] = Field(default_factory=list, description="Underlying mental models")
-    analogical_sources: List[str] = Field(default_factory=list, description="Domains used for analogies")
+    identified_frameworks: Tuple[str, ...] = Field(default_factory=tuple, description="Named frameworks referenced")
+    implicit_models: Tuple[str, ...] = Field(default_factory=tuple, description="Underlying mental models")
+    analogical_sources: Tuple[str, ...] = Field(default_factory=tuple, description="Domains used for analogies")
 
 
-class CognitiveProfile(BaseModel):
+class CognitiveProfile(_FrozenModel):
     """Complete cognitive pattern analysis"""
     reasoning_patterns: ReasoningPatterns
     mental_models: MentalModels
@@ -77,28 +92,28 @@ class CognitiveProfile(BaseModel):
 # Emotional Profile
 # ============================================================================
 
-class EmotionalTriggers(BaseModel):
+class EmotionalTriggers(_FrozenModel):
     """What evokes emotional responses"""
-    excites: List[str] = Field(default_factory=list, description="Topics/situations that generate enthusiasm")
-    frustrates: List[str] = Field(default_factory=list, description="Pain points and frustrations")
-    motivates: List[str] = Field(default_factory=list, description="Core motivational drivers")
-    calms: List[str] = Field(default_factory=list, description="Sources of comfort/stability")
+    excites: Tuple[str, ...] = Field(default_factory=tuple, description="Topics/situations that generate enthusiasm")
+    frustrates: Tuple[str, ...] = Field(default_factory=tuple, description="Pain points and frustrations")
+    motivates: Tuple[str, ...] = Field(default_factory=tuple, description="Core motivational drivers")
+    calms: Tuple[str, ...] = Field(default_factory=tuple, description="Sources of comfort/stability")
 
 
-class PassionMap(BaseModel):
+class PassionMap(_FrozenModel):
     """Intensity of engagement by topic"""
-    high_passion: List[str] = Field(default_factory=list, description="Topics with deep passion")
-    moderate_interest: List[str] = Field(default_factory=list, description="Areas of steady interest")
-    emerging_curiosity: List[str] = Field(default_factory=list, description="Growing interests")
+    high_passion: Tuple[str, ...] = Field(default_factory=tuple, description="Topics with deep passion")
+    moderate_interest: Tuple[str, ...] = Field(default_factory=tuple, description="Areas of steady interest")
+    emerging_curiosity: Tuple[str, ...] = Field(default_factory=tuple, description="Growing interests")
 
 
-class EmotionalProfile(BaseModel):
+class EmotionalProfile(_FrozenModel):
     """Complete emotional pattern analysis"""
     triggers: EmotionalTriggers
     passion_map: PassionMap
     expression_patterns: str = Field(description="How emotions are expressed in writing")
-    emotional_vocabulary: List[str] = Field(default_factory=list, description="Characteristic emotional words")
-    values_from_emotion: List[str] = Field(default_factory=list, description="Values inferred from emotional emphasis")
+    emotional_vocabulary: Tuple[str, ...] = Field(default_factory=tuple, description="Characteristic emotional words")
+    values_from_emotion: Tuple[str, ...] = Field(default_factory=tuple, description="Values inferred from emotional emphasis")
     emotional_baseline: str = Field(description="Default emotional state in writing")
     emotional_description: str = Field(description="Natural language summary of emotional patterns")
     confidence: float = Field(ge=0, le=1, description="Confidence in this analysis")
@@ -108,21 +123,21 @@ class EmotionalProfile(BaseModel):
 # Interest Profile
 # ============================================================================
 
-class Interest(BaseModel):
+class Interest(_FrozenModel):
     """A single interest with depth information"""
     topic: str = Field(description="The interest area")
     depth: float = Field(ge=0, le=1, description="Depth of engagement 0-1")
-    evidence: List[str] = Field(default_factory=list, description="What indicates this interest")
+    evidence: Tuple[str, ...] = Field(default_factory=tuple, description="What indicates this interest")
     context: str = Field(description="How this interest manifests")
 
 
-class InterestProfile(BaseModel):
+class InterestProfile(_FrozenModel):
     """Complete interest and desire analysis"""
-    genuine_interests: List[Interest] = Field(default_factory=list, description="Core interests with depth scores")
-    curiosities: List[str] = Field(default_factory=list, description="Active areas of exploration")
-    aspirations: List[str] = Field(default_factory=list, description="Goals and desires inferred from writing")
+    genuine_interests: Tuple[Interest, ...] = Field(default_factory=tuple, description="Core interests with depth scores")
+    curiosities: Tuple[str, ...] = Field(default_factory=tuple, description="Active areas of exploration")
+    aspirations: Tuple[str, ...] = Field(default_factory=tuple, description="Goals and desires inferred from writing")
     topic_affinities: Dict[str, float] = Field(default_factory=dict, description="Topic engagement scores")
-    learning_trajectories: List[str] = Field(default_factory=list, description="Knowledge pursuit patterns")
+    learning_trajectories: Tuple[str, ...] = Field(default_factory=tuple, description="Knowledge pursuit patterns")
     interest_description: str = Field(description="Natural language summary of interests")
     confidence: float = Field(ge=0, le=1, description="Confidence in this analysis")
 
@@ -131,19 +146,19 @@ class InterestProfile(BaseModel):
 # Worldview Profile
 # ============================================================================
 
-class CoreBeliefs(BaseModel):
+class CoreBeliefs(_FrozenModel):
     """Fundamental beliefs and assumptions"""
-    explicit_beliefs: List[str] = Field(default_factory=list, description="Directly stated beliefs")
-    implicit_assumptions: List[str] = Field(default_factory=list, description="Underlying assumptions")
-    values_hierarchy: List[str] = Field(default_factory=list, description="Core values in priority order")
+    explicit_beliefs: Tuple[str, ...] = Field(default_factory=tuple, description="Directly stated beliefs")
+    implicit_assumptions: Tuple[str, ...] = Field(default_factory=tuple, description="Underlying assumptions")
+    values_hierarchy: Tuple[str, ...] = Field(default_factory=tuple, description="Core values in priority order")
 
 
-class WorldviewProfile(BaseModel):
+class WorldviewProfile(_FrozenModel):
     """Complete worldview analysis"""
     core_beliefs: CoreBeliefs
-    philosophical_leanings: List[str] = Field(default_factory=list, description="Philosophical orientations")
+    philosophical_leanings: Tuple[str, ...] = Field(default_factory=tuple, description="Philosophical orientations")
     framing_patterns: str = Field(description="How problems and opportunities are framed")
-    unique_perspectives: List[str] = Field(default_factory=list, description="Distinctive viewpoints")
+    unique_perspectives: Tuple[str, ...] = Field(default_factory=tuple, description="Distinctive viewpoints")
     domain_lenses: Dict[str, str] = Field(default_factory=dict, description="Perspective by domain")
     epistemology: str = Field(description="How they approach knowledge and truth")
     worldview_description: str = Field(description="Natural language summary of worldview")
@@ -154,7 +169,7 @@ class WorldviewProfile(BaseModel):
 # Social Profile
 # ============================================================================
 
-class CommunicationDynamics(BaseModel):
+class CommunicationDynamics(_FrozenModel):
     """How communication unfolds"""
     initiation_style: str = Field(description="How conversations are started")
     response_patterns: str = Field(description="How responses are structured")
@@ -162,13 +177,13 @@ class CommunicationDynamics(BaseModel):
     directness_level: str = Field(description="Communication directness")
 
 
-class SocialProfile(BaseModel):
+class SocialProfile(_FrozenModel):
     """Complete social pattern analysis"""
     communication_dynamics: CommunicationDynamics
     collaboration_style: str = Field(description="How they work with others")
     authority_positioning: str = Field(description="How expertise/authority is conveyed")
     audience_adaptation: Dict[str, str] = Field(default_factory=dict, description="Style shifts by audience")
-    relational_patterns: List[str] = Field(default_factory=list, description="Relationship building patterns")
+    relational_patterns: Tuple[str, ...] = Field(default_factory=tuple, description="Relationship building patterns")
     conflict_approach: str = Field(description="How disagreement is handled")
     social_description: str = Field(description="Natural language summary of social patterns")
     confidence: float = Field(ge=0, le=1, description="Confidence in this analysis")
@@ -178,7 +193,7 @@ class SocialProfile(BaseModel):
 # Complete Personality Profile
 # ============================================================================
 
-class AnalysisMetadata(BaseModel):
+class AnalysisMetadata(_FrozenModel):
     """Metadata about the analysis process"""
     model_config = {"protected_namespaces": ()}
     
@@ -188,7 +203,7 @@ class AnalysisMetadata(BaseModel):
     model_used: str = Field(description="LLM model used for analysis")
 
 
-class PersonalityProfile(BaseModel):
+class PersonalityProfile(_FrozenModel):
     """Complete AI-analyzed personality profile"""
     version: int = 2  # Version 2 indicates new AI-powered schema
     
@@ -202,86 +217,83 @@ class PersonalityProfile(BaseModel):
     
     # Synthesis
     personality_essence: str = Field(description="One-paragraph essence capturing the whole person")
-    key_characteristics: List[str] = Field(default_factory=list, description="Top distinguishing traits")
+    key_characteristics: Tuple[str, ...] = Field(default_factory=tuple, description="Top distinguishing traits")
     context_variations: Dict[str, str] = Field(default_factory=dict, description="How personality shifts by context")
     
     # Metadata
     analysis_metadata: Optional[AnalysisMetadata] = None
     overall_confidence: float = Field(ge=0, le=1, description="Overall profile confidence")
+    min_confidence: float = Field(default=0.0, ge=0, le=1, description="Weakest dimension confidence - gate for low-quality profiles")
+
+    # Rendered prompt text, cached on first use: the profile never
+    # changes after synthesis (updates create a new instance) but
+    # to_prompt_text runs on every chat turn
+    _prompt_text: Optional[str] = PrivateAttr(default=None)
 
     def to_prompt_text(self) -> str:
         """Convert profile to rich text for LLM prompts"""
-        sections = [
-            "PERSONALITY PROFILE",
-            "=" * 50,
-            "",
-            "## ESSENCE",
-            self.personality_essence,
-            "",
-            "## KEY CHARACTERISTICS",
-            *[f"- {c}" for c in self.key_characteristics[:7]],
-            "",
-            "## WRITING VOICE",
-            self.writing_style.voice_description,
-            f"- Rhythm: {self.writing_style.rhythm.pacing_description}",
-            f"- Tone: {self.writing_style.tonal_range.default_tone}",
-            f"- Vocabulary: {self.writing_style.vocabulary_character}",
-            "",
-            "Signature phrases and patterns:",
-            *[f'  - "{p}"' for p in self.writing_style.stylistic_markers.signature_phrases[:5]],
-            "",
-            "## THINKING PATTERNS",
-            self.cognitive.thinking_description,
-            f"- Reasoning: {self.cognitive.reasoning_patterns.primary_mode}",
-            f"- Problem-solving: {self.cognitive.problem_solving_style}",
-            f"- Connects ideas: {self.cognitive.idea_connection_style}",
-            "",
-            "## EMOTIONAL LANDSCAPE",
-            self.emotional.emotional_description,
-            "",
-            "What excites:",
-            *[f"  - {e}" for e in self.emotional.triggers.excites[:4]],
-            "",
-            "What frustrates:",
-            *[f"  - {f}" for f in self.emotional.triggers.frustrates[:3]],
-            "",
-            "Core motivations:",
-            *[f"  - {m}" for m in self.emotional.triggers.motivates[:4]],
-            "",
-            "## INTERESTS & PASSIONS",
-            self.interests.interest_description,
-            "",
-            "Deep interests:",
-            *[f"  - {i.topic} (depth: {i.depth:.0%})" for i in self.interests.genuine_interests[:5]],
-            "",
-            "Aspirations:",
-            *[f"  - {a}" for a in self.interests.aspirations[:4]],
-            "",
-            "## WORLDVIEW",
-            self.worldview.worldview_description,
-            "",
-            "Core values:",
-            *[f"  - {v}" for v in self.worldview.core_beliefs.values_hierarchy[:5]],
-            "",
-            "Philosophical leanings:",
-            *[f"  - {p}" for p in self.worldview.philosophical_leanings[:3]],
-            "",
-            "## SOCIAL DYNAMICS",
-            self.social.social_description,
-            f"- Communication style: {self.social.communication_dynamics.directness_level}",
-            f"- Collaboration: {self.social.collaboration_style}",
-            f"- Authority: {self.social.authority_positioning}",
-        ]
-        
+        if self._prompt_text is None:
+            self._prompt_text = self._render_prompt_text()
+        return self._prompt_text
+
+    def _render_prompt_text(self) -> str:
+        # One growable buffer instead of ~80 small strings collected into
+        # a list and re-scanned by "\n".join
+        style = self.writing_style
+        buf = io.StringIO()
+        write = buf.write
+
+        write("PERSONALITY PROFILE\n")
+        write("=" * 50)
+        write("\n\n## ESSENCE\n")
+        write(f"{self.personality_essence}\n")
+        write("\n## KEY CHARACTERISTICS\n")
+        buf.writelines(f"- {c}\n" for c in islice(self.key_characteristics, 7))
+        write("\n## WRITING VOICE\n")
+        write(f"{style.voice_description}\n")
+        write(f"- Rhythm: {style.rhythm.pacing_description}\n")
+        write(f"- Tone: {style.tonal_range.default_tone}\n")
+        write(f"- Vocabulary: {style.vocabulary_character}\n")
+        write("\nSignature phrases and patterns:\n")
+        buf.writelines(f'  - "{p}"\n' for p in islice(style.stylistic_markers.signature_phrases, 5))
+        write("\n## THINKING PATTERNS\n")
+        write(f"{self.cognitive.thinking_description}\n")
+        write(f"- Reasoning: {self.cognitive.reasoning_patterns.primary_mode}\n")
+        write(f"- Problem-solving: {self.cognitive.problem_solving_style}\n")
+        write(f"- Connects ideas: {self.cognitive.idea_connection_style}\n")
+        write("\n## EMOTIONAL LANDSCAPE\n")
+        write(f"{self.emotional.emotional_description}\n")
+        write("\nWhat excites:\n")
+        buf.writelines(f"  - {e}\n" for e in islice(self.emotional.triggers.excites, 4))
+        write("\nWhat frustrates:\n")
+        buf.writelines(f"  - {f}\n" for f in islice(self.emotional.triggers.frustrates, 3))
+        write("\nCore motivations:\n")
+        buf.writelines(f"  - {m}\n" for m in islice(self.emotional.triggers.motivates, 4))
+        write("\n## INTERESTS & PASSIONS\n")
+        write(f"{self.interests.interest_description}\n")
+        write("\nDeep interests:\n")
+        buf.writelines(f"  - {i.topic} (depth: {i.depth:.0%})\n" for i in islice(self.interests.genuine_interests, 5))
+        write("\nAspirations:\n")
+        buf.writelines(f"  - {a}\n" for a in islice(self.interests.aspirations, 4))
+        write("\n## WORLDVIEW\n")
+        write(f"{self.worldview.worldview_description}\n")
+        write("\nCore values:\n")
+        buf.writelines(f"  - {v}\n" for v in islice(self.worldview.core_beliefs.values_hierarchy, 5))
+        write("\nPhilosophical leanings:\n")
+        buf.writelines(f"  - {p}\n" for p in islice(self.worldview.philosophical_leanings, 3))
+        write("\n## SOCIAL DYNAMICS\n")
+        write(f"{self.social.social_description}\n")
+        write(f"- Communication style: {self.social.communication_dynamics.directness_level}\n")
+        write(f"- Collaboration: {self.social.collaboration_style}\n")
+        write(f"- Authority: {self.social.authority_positioning}")
+
         # Add context variations if present
         if self.context_variations:
-            sections.extend([
-                "",
-                "## CONTEXT ADAPTATIONS",
-                *[f"- In {ctx}: {desc}" for ctx, desc in list(self.context_variations.items())[:4]],
-            ])
-        
-        return "\n".join(sections)
+            write("\n\n## CONTEXT ADAPTATIONS")
+            for ctx, desc in islice(self.context_variations.items(), 4):
+                write(f"\n- In {ctx}: {desc}")
+
+        return buf.getvalue()
 
     def get_dimension_confidence(self) -> Dict[str, float]:
         """Get confidence scores for each dimension"""
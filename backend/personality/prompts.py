@@ -2,9 +2,75 @@
 LLM Prompt Library for AI-Powered Personality Analysis
 
 Each prompt is designed to extract deep, nuanced patterns rather than surface-level features.
-Prompts output structured JSON for reliable parsing.
+Response schemas are rendered as compact Python-style class declarations
+generated from the pydantic response models, so the models stay the single
+source of truth and the prompts carry the structure in a fraction of the
+tokens an equivalent JSON example would cost. The real output shape is
+enforced separately by the forced tool schema on each API call.
 """
 
+from typing import get_args
+
+from pydantic import BaseModel
+
+from backend.personality.profile import (
+    WritingStyleProfile, CognitiveProfile, EmotionalProfile,
+    InterestProfile, WorldviewProfile, SocialProfile
+)
+
+
+# ============================================================================
+# Schema rendering
+# ============================================================================
+
+def _annotation_name(annotation) -> str:
+    """Readable name for a field annotation (list[str], dict[str, float], ...)"""
+    if annotation is Ellipsis:  # the variadic marker in tuple[str, ...]
+        return "..."
+    args = get_args(annotation)
+    if args:
+        origin = annotation.__origin__
+        inner = ", ".join(_annotation_name(a) for a in args)
+        return f"{origin.__name__}[{inner}]"
+    return getattr(annotation, "__name__", str(annotation))
+
+
+def _nested_models(annotation):
+    """Yield every BaseModel subclass reachable from an annotation"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+    for arg in get_args(annotation):
+        yield from _nested_models(arg)
+
+
+def pythonic_schema(cls) -> str:
+    """
+    Render a response model as Python-style class declarations.
+
+    Field descriptions become trailing comments, and nested models are
+    declared before the classes that use them.
+    """
+    blocks = []
+    seen = set()
+
+    def render(model_cls) -> None:
+        if model_cls in seen:
+            return
+        seen.add(model_cls)
+        lines = [f"class {model_cls.__name__}:"]
+        for name, field in model_cls.model_fields.items():
+            for sub in _nested_models(field.annotation):
+                render(sub)
+            line = f"    {name}: {_annotation_name(field.annotation)}"
+            if field.description:
+                line += f"  # {field.description}"
+            lines.append(line)
+        blocks.append("\n".join(lines))
+
+    render(cls)
+    return "\n\n".join(blocks)
+
+
 # ============================================================================
 # PASS 1: Pattern Extraction Prompts
 # ============================================================================
@@ -20,32 +86,8 @@ Go beyond surface metrics. Look for:
 WRITING SAMPLES:
 {text_samples}
 
-Respond with a JSON object (no markdown):
-{{
-    "rhythm": {{
-        "pacing_description": "natural language description of the writing pace and flow",
-        "sentence_variation": "how sentence length varies",
-        "paragraph_style": "how paragraphs are organized",
-        "flow_characteristics": ["key flow traits"]
-    }},
-    "stylistic_markers": {{
-        "signature_phrases": ["distinctive phrases they use repeatedly"],
-        "metaphor_patterns": ["types of metaphors/analogies they favor"],
-        "transition_style": "how they bridge between ideas",
-        "emphasis_patterns": ["how they convey emphasis"],
-        "punctuation_habits": "notable punctuation patterns"
-    }},
-    "tonal_range": {{
-        "default_tone": "primary tonal quality",
-        "tonal_shifts": {{"context": "tone in that context"}},
-        "emotional_coloring": "how emotion colors the writing",
-        "formality_spectrum": "formality range and default"
-    }},
-    "linguistic_fingerprints": ["unique language patterns that identify this writer"],
-    "vocabulary_character": "description of vocabulary sophistication and character",
-    "voice_description": "2-3 sentence summary of their distinctive writing voice",
-    "confidence": 0.0 to 1.0
-}}"""
+Respond with a WritingStyleProfile object:
+""" + pythonic_schema(WritingStyleProfile)
 
 
 COGNITIVE_EXTRACTION_PROMPT = """Analyze the following writing samples to understand how this person thinks and reasons.
@@ -59,26 +101,8 @@ Look for:
 WRITING SAMPLES:
 {text_samples}
 
-Respond with a JSON object (no markdown):
-{{
-    "reasoning_patterns": {{
-        "primary_mode": "deductive/inductive/abductive/mixed",
-        "logical_style": "linear/associative/dialectical",
-        "evidence_preference": "how evidence is weighted and used",
-        "abstraction_level": "preference for concrete vs abstract"
-    }},
-    "mental_models": {{
-        "identified_frameworks": ["named frameworks they reference"],
-        "implicit_models": ["underlying mental models they use"],
-        "analogical_sources": ["domains they draw analogies from"]
-    }},
-    "problem_solving_style": "their approach to tackling problems",
-    "idea_connection_style": "how they link and build upon ideas",
-    "learning_approach": "how they process new information",
-    "complexity_preference": "their tolerance for and attraction to complexity",
-    "thinking_description": "2-3 sentence summary of their thinking style",
-    "confidence": 0.0 to 1.0
-}}"""
+Respond with a CognitiveProfile object:
+""" + pythonic_schema(CognitiveProfile)
 
 
 EMOTIONAL_EXTRACTION_PROMPT = """Analyze the following writing samples to understand this person's emotional patterns and what drives them.
@@ -92,26 +116,8 @@ Look beyond keywords. Identify:
 WRITING SAMPLES:
 {text_samples}
 
-Respond with a JSON object (no markdown):
-{{
-    "triggers": {{
-        "excites": ["topics/situations that generate genuine enthusiasm"],
-        "frustrates": ["pain points and sources of frustration"],
-        "motivates": ["core drivers - what pushes them forward"],
-        "calms": ["sources of comfort or stability"]
-    }},
-    "passion_map": {{
-        "high_passion": ["topics with deep, visible passion"],
-        "moderate_interest": ["areas of steady engagement"],
-        "emerging_curiosity": ["growing or developing interests"]
-    }},
-    "expression_patterns": "how emotions are expressed in their writing",
-    "emotional_vocabulary": ["characteristic emotional words and phrases"],
-    "values_from_emotion": ["values inferred from what evokes emotion"],
-    "emotional_baseline": "their default emotional state in writing",
-    "emotional_description": "2-3 sentence summary of their emotional patterns",
-    "confidence": 0.0 to 1.0
-}}"""
+Respond with an EmotionalProfile object:
+""" + pythonic_schema(EmotionalProfile)
 
 
 INTEREST_EXTRACTION_PROMPT = """Analyze the following writing samples to understand this person's genuine interests, desires, and aspirations.
@@ -125,23 +131,8 @@ Don't just count topic mentions. Look for:
 WRITING SAMPLES:
 {text_samples}
 
-Respond with a JSON object (no markdown):
-{{
-    "genuine_interests": [
-        {{
-            "topic": "interest area",
-            "depth": 0.0 to 1.0,
-            "evidence": ["what indicates this interest"],
-            "context": "how this interest manifests"
-        }}
-    ],
-    "curiosities": ["areas they're actively exploring"],
-    "aspirations": ["goals, desires, ambitions inferred from writing"],
-    "topic_affinities": {{"topic": 0.0 to 1.0}},
-    "learning_trajectories": ["knowledge pursuit patterns"],
-    "interest_description": "2-3 sentence summary of their interests and what drives them",
-    "confidence": 0.0 to 1.0
-}}"""
+Respond with an InterestProfile object:
+""" + pythonic_schema(InterestProfile)
 
 
 WORLDVIEW_EXTRACTION_PROMPT = """Analyze the following writing samples to understand this person's worldview, beliefs, and unique perspective.
@@ -155,21 +146,8 @@ Look for:
 WRITING SAMPLES:
 {text_samples}
 
-Respond with a JSON object (no markdown):
-{{
-    "core_beliefs": {{
-        "explicit_beliefs": ["beliefs they directly state"],
-        "implicit_assumptions": ["assumptions underlying their writing"],
-        "values_hierarchy": ["values in priority order"]
-    }},
-    "philosophical_leanings": ["philosophical orientations - optimism/pragmatism/etc"],
-    "framing_patterns": "how they typically frame problems and opportunities",
-    "unique_perspectives": ["distinctive viewpoints they hold"],
-    "domain_lenses": {{"domain": "their perspective on it"}},
-    "epistemology": "how they approach knowledge and truth",
-    "worldview_description": "2-3 sentence summary of their worldview",
-    "confidence": 0.0 to 1.0
-}}"""
+Respond with a WorldviewProfile object:
+""" + pythonic_schema(WorldviewProfile)
 
 
 SOCIAL_EXTRACTION_PROMPT = """Analyze the following writing samples to understand this person's social and communication patterns.
@@ -183,22 +161,8 @@ Look for:
 WRITING SAMPLES:
 {text_samples}
 
-Respond with a JSON object (no markdown):
-{{
-    "communication_dynamics": {{
-        "initiation_style": "how they start conversations or topics",
-        "response_patterns": "how they structure responses",
-        "engagement_depth": "typical depth of engagement",
-        "directness_level": "direct to indirect spectrum"
-    }},
-    "collaboration_style": "how they work with others",
-    "authority_positioning": "how expertise/authority is conveyed",
-    "audience_adaptation": {{"audience_type": "style adaptation"}},
-    "relational_patterns": ["patterns in how they build/maintain relationships"],
-    "conflict_approach": "how they handle disagreement",
-    "social_description": "2-3 sentence summary of their social patterns",
-    "confidence": 0.0 to 1.0
-}}"""
+Respond with a SocialProfile object:
+""" + pythonic_schema(SocialProfile)
 
 
 # ============================================================================
@@ -209,7 +173,7 @@ SYNTHESIS_PROMPT = """You are synthesizing a personality profile from multiple a
 
 You have analyzed this person across six dimensions:
 1. Writing Style
-2. Cognitive Patterns  
+2. Cognitive Patterns
 3. Emotional Patterns
 4. Interests
 5. Worldview
@@ -225,18 +189,13 @@ Your task is to:
 4. Resolve any contradictions - If dimensions conflict, determine what's core vs. situational.
 5. Calculate OVERALL CONFIDENCE based on consistency and evidence strength.
 
-Respond with a JSON object (no markdown):
-{{
-    "personality_essence": "One compelling paragraph capturing who this person is",
-    "key_characteristics": ["The 5-7 most distinguishing traits"],
-    "context_variations": {{
-        "professional": "how personality manifests professionally",
-        "personal": "how personality manifests personally",
-        "creative": "how personality manifests in creative contexts"
-    }},
-    "contradictions_resolved": ["any conflicts identified and how they were resolved"],
-    "overall_confidence": 0.0 to 1.0
-}}"""
+Respond with a ProfileSynthesis object:
+class ProfileSynthesis:
+    personality_essence: str  # One compelling paragraph capturing who this person is
+    key_characteristics: list[str]  # The 5-7 most distinguishing traits
+    context_variations: dict[str, str]  # professional/personal/creative -> how personality manifests there
+    contradictions_resolved: list[str]  # conflicts identified and how they were resolved
+    overall_confidence: float  # 0-1, based on consistency and evidence strength"""
 
 
 # ============================================================================
@@ -261,3 +220,48 @@ DIMENSION_NAMES = {
     "social": "Social Dynamics",
 }
 
+_RESPONSE_MODELS = {
+    "writing_style": WritingStyleProfile,
+    "cognitive": CognitiveProfile,
+    "emotional": EmotionalProfile,
+    "interests": InterestProfile,
+    "worldview": WorldviewProfile,
+    "social": SocialProfile,
+}
+
+
+# ============================================================================
+# Fused Pass 1: all six dimensions in one call
+# ============================================================================
+
+def _build_fused_extraction_prompt() -> str:
+    """Assemble the single-call Pass-1 prompt from the per-dimension prompts.
+
+    The writing samples are sent once instead of six times (they dwarf the
+    per-dimension instructions), and one round trip replaces six. Derived
+    from EXTRACTION_PROMPTS so the per-dimension schemas stay the single
+    source of truth.
+    """
+    sections = []
+    for dimension, prompt in EXTRACTION_PROMPTS.items():
+        instructions, _, _ = prompt.partition("WRITING SAMPLES:\n{text_samples}")
+        sections.append(
+            f'## {DIMENSION_NAMES[dimension]} (key: "{dimension}")\n\n'
+            f"{instructions.strip()}\n\n"
+            f'Schema for the "{dimension}" key:\n'
+            f"{pythonic_schema(_RESPONSE_MODELS[dimension])}"
+        )
+
+    return (
+        "Analyze the following writing samples across all six personality "
+        "dimensions described below.\n\n"
+        "WRITING SAMPLES:\n{text_samples}\n\n"
+        + "\n\n".join(sections)
+        + "\n\nRespond with a single object whose top-level keys "
+        'are exactly: "writing_style", "cognitive", "emotional", "interests", '
+        '"worldview", "social" - each mapping to an object matching that '
+        "dimension's schema."
+    )
+
+
+FUSED_EXTRACTION_PROMPT = _build_fused_extraction_prompt()
@@ -1,56 +1,186 @@
-from openai import OpenAI
-from typing import List, Optional
+from openai import APIConnectionError, APITimeoutError, OpenAI, RateLimitError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from typing import Iterable, Iterator, List, Optional, Tuple
 from backend.config import settings
 from backend.logging_config import get_logger, PerformanceTimer
+import numpy as np
+import httpx
+import orjson
+import re
 import tiktoken
 import hashlib
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 
 logger = get_logger(__name__)
 
-def _get_openai_client() -> OpenAI:
-    """Get OpenAI client with API key validation."""
+@lru_cache(maxsize=1)
+def _get_client() -> OpenAI:
+    """Get or create the OpenAI client with API key validation.
+
+    Built lazily (after settings are loaded, and patchable in tests) on
+    an explicitly pooled httpx client, so concurrent embedding batches
+    reuse keep-alive connections instead of paying TCP/TLS handshakes
+    per request.
+    """
     if not settings.OPENAI_API_KEY or not settings.OPENAI_API_KEY.strip():
         raise ValueError(
             "OPENAI_API_KEY is not set. Please add it to your .env file:\n"
             "OPENAI_API_KEY=sk-your-api-key-here"
         )
-    return OpenAI(api_key=settings.OPENAI_API_KEY)
+    return OpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        http_client=httpx.Client(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        ),
+    )
 
-_client: Optional[OpenAI] = None
+# Sentence boundary: one compiled pattern splitting after terminal
+# punctuation, replacing a chain of three .replace() passes that each
+# copied the paragraph (and broke on '!"' etc. without a space)
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
 
-def _get_client() -> OpenAI:
-    """Get or create OpenAI client."""
-    global _client
-    if _client is None:
-        _client = _get_openai_client()
-    return _client
+# Whitespace normalization for embedding input: one translate pass
+# instead of chained .replace() copies
+_NL_TABLE = str.maketrans("\n\r\t", "   ")
 
 # Constants for optimization
 MAX_BATCH_SIZE = 2048  # OpenAI API limit for text-embedding-3-large
+MAX_BATCH_TOKENS = 7500  # Per-request token budget, under the model's 8191-token input limit
 MAX_RETRIES = 3
 RETRY_DELAY = 1  # seconds
 
-# Dynamic cache size from settings
-_cache_size = lambda: settings.EMBEDDING_CACHE_SIZE
 
-@lru_cache(maxsize=None)  # Will be constrained by wrapper
-def _get_cached_embedding(text_hash: str, model: str) -> Optional[tuple]:
-    """Cache wrapper - returns None for cache miss, uses hash for cache key"""
-    return None
+class _RateLimiter:
+    """
+    Thread-safe request+token bucket shared by all embedding calls.
+
+    Bursty concurrent dispatch earns 429s faster than it does work;
+    pacing submission to the account's per-minute request and token
+    ceilings keeps throughput at steady-state saturation instead of
+    oscillating through rate-limit backoff.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self._lock = threading.Lock()
+        self._rpm = rpm
+        self._tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last_refill = time.monotonic()
+
+    def acquire(self, tokens: int) -> None:
+        """Block until one request and the given token budget are available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._last_refill
+                self._last_refill = now
+                self._requests = min(float(self._rpm), self._requests + elapsed * self._rpm / 60.0)
+                self._tokens = min(float(self._tpm), self._tokens + elapsed * self._tpm / 60.0)
+                if self._requests >= 1.0 and self._tokens >= tokens:
+                    self._requests -= 1.0
+                    self._tokens -= tokens
+                    return
+                wait = max(
+                    (1.0 - self._requests) * 60.0 / self._rpm,
+                    (tokens - self._tokens) * 60.0 / self._tpm,
+                )
+            time.sleep(wait)
+
+
+_rate_limiter = _RateLimiter(settings.OPENAI_RPM, settings.OPENAI_TPM)
+
+
+def _log_retry(retry_state) -> None:
+    """before_sleep hook: surface each backoff the way the old manual loops did"""
+    logger.warning(
+        "embedding_api_retry",
+        attempt=retry_state.attempt_number,
+        wait_seconds=round(retry_state.next_action.sleep, 1),
+        error=str(retry_state.outcome.exception())
+    )
+
+
+# Shared retry policy for embedding API calls: exponential backoff with
+# jitter on transient failures only, so rate-limited workers spread out
+# instead of retrying in lockstep. Anything else (auth, bad request)
+# surfaces immediately.
+_retry_api_call = retry(
+    stop=stop_after_attempt(MAX_RETRIES),
+    wait=wait_exponential_jitter(initial=RETRY_DELAY, max=30),
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError, APITimeoutError)),
+    before_sleep=_log_retry,
+    reraise=True,
+)
 
-def _compute_text_hash(text: str) -> str:
-    """Compute deterministic hash for text caching"""
-    return hashlib.sha256(text.encode()).hexdigest()
 
-def get_embedding(text: str, model: Optional[str] = None) -> List[float]:
+@_retry_api_call
+def _embed_one(text: str, model: str) -> np.ndarray:
+    _rate_limiter.acquire(_token_len(text, "cl100k_base"))
+    response = _get_client().embeddings.create(input=[text], model=model)
+    return np.asarray(response.data[0].embedding, dtype=np.float32)
+
+# Embedding cache: LRU keyed on (content hash, model), bounded by
+# EMBEDDING_CACHE_SIZE, entries stored int8-quantized with a per-vector
+# scale. Vectors cost real money to recompute, so misses only happen
+# for genuinely new text. Lock-guarded because batches are embedded
+# from worker threads.
+_cache_lock = threading.Lock()
+_embedding_cache: "OrderedDict[tuple, Tuple[np.ndarray, float]]" = OrderedDict()
+
+
+def _cache_get(text_hash: bytes, model: str) -> Optional[np.ndarray]:
+    """Return the cached vector or None, refreshing recency on hit"""
+    key = (text_hash, model)
+    with _cache_lock:
+        entry = _embedding_cache.get(key)
+        if entry is None:
+            return None
+        _embedding_cache.move_to_end(key)
+        quantized, scale = entry
+    return quantized.astype(np.float32) * scale
+
+
+def _cache_put(text_hash: bytes, model: str, vec: np.ndarray) -> None:
+    """Store a vector, evicting least recently used entries past the cap.
+
+    Entries are scalar-quantized to int8 with a per-vector scale: a
+    quarter the RAM of float32, and text-embedding-3 vectors tolerate
+    the rounding with negligible retrieval-quality loss. Only the cache
+    holds int8 - callers always see dequantized float32.
+    """
+    vec = np.asarray(vec, dtype=np.float32)
+    scale = float(np.abs(vec).max()) / 127.0 or 1.0
+    quantized = np.round(vec / scale).astype(np.int8)
+    with _cache_lock:
+        _embedding_cache[(text_hash, model)] = (quantized, scale)
+        while len(_embedding_cache) > settings.EMBEDDING_CACHE_SIZE:
+            _embedding_cache.popitem(last=False)
+
+
+def _compute_text_hash(text: str) -> bytes:
+    """Deterministic 16-byte key for text caching.
+
+    The truncated raw digest is the cache key; skipping hex encoding and
+    the other 16 bytes costs nothing for collision purposes at cache
+    scale and quarters per-key memory.
+    """
+    return hashlib.sha256(text.encode()).digest()[:16]
+
+def get_embedding(text: str, model: Optional[str] = None) -> np.ndarray:
     """
     Generate embedding for a single text with caching and retry logic.
-    Uses OpenAI's text-embedding-3-large (best quality, 3072 dimensions)
+    Uses OpenAI's text-embedding-3-large (best quality, 3072 dimensions).
+    Returns a float32 array: a quarter the memory of boxed Python floats,
+    and downstream numpy/Chroma consumers skip a reconversion.
     """
     model = model or settings.OPENAI_EMBEDDING_MODEL
-    text = text.replace("\n", " ").strip()
+    text = text.translate(_NL_TABLE).strip()
     
     if not text:
         logger.error("empty_text_for_embedding")
@@ -58,45 +188,30 @@ def get_embedding(text: str, model: Optional[str] = None) -> List[float]:
     
     # Try cache first
     text_hash = _compute_text_hash(text)
-    cached = _get_cached_embedding(text_hash, model)
-    if cached:
-        logger.debug("embedding_cache_hit", text_hash=text_hash[:16])
-        return list(cached)
-    
-    logger.debug("embedding_cache_miss_generating", text_hash=text_hash[:16], model=model)
-    
-    # Generate with retry logic
-    for attempt in range(MAX_RETRIES):
-        try:
-            with PerformanceTimer(logger, "generate_single_embedding", model=model, attempt=attempt+1):
-                response = _get_client().embeddings.create(input=[text], model=model)
-                embedding = response.data[0].embedding
-            
-            # Cache result
-            _get_cached_embedding(text_hash, model)  # Prime cache
-            logger.debug("embedding_generated_successfully", text_hash=text_hash[:16])
-            return embedding
-        except Exception as e:
-            if attempt == MAX_RETRIES - 1:
-                logger.error(
-                    "embedding_generation_failed",
-                    text_hash=text_hash[:16],
-                    attempts=MAX_RETRIES,
-                    error=str(e),
-                    exc_info=True
-                )
-                raise Exception(f"Failed to generate embedding after {MAX_RETRIES} attempts: {e}")
-            logger.warning(
-                "embedding_generation_retry",
-                text_hash=text_hash[:16],
-                attempt=attempt+1,
-                error=str(e)
-            )
-            time.sleep(RETRY_DELAY * (attempt + 1))
+    cached = _cache_get(text_hash, model)
+    if cached is not None:
+        logger.debug("embedding_cache_hit", text_hash=text_hash.hex())
+        return cached
     
-    raise Exception("Embedding generation failed")
+    logger.debug("embedding_cache_miss_generating", text_hash=text_hash.hex(), model=model)
 
-def get_embeddings(texts: List[str], model: Optional[str] = None, batch_size: Optional[int] = None) -> List[List[float]]:
+    try:
+        with PerformanceTimer(logger, "generate_single_embedding", model=model):
+            embedding = _embed_one(text, model)
+    except Exception as e:
+        logger.error(
+            "embedding_generation_failed",
+            text_hash=text_hash.hex(),
+            error=str(e),
+            exc_info=True
+        )
+        raise
+
+    _cache_put(text_hash, model, embedding)
+    logger.debug("embedding_generated_successfully", text_hash=text_hash.hex())
+    return embedding
+
+def get_embeddings(texts: List[str], model: Optional[str] = None, batch_size: Optional[int] = None) -> np.ndarray:
     """
     Generate embeddings for multiple texts with intelligent batching and error handling.
     
@@ -106,7 +221,7 @@ def get_embeddings(texts: List[str], model: Optional[str] = None, batch_size: Op
         batch_size: Number of texts per API call (default from settings, max 2048)
     
     Returns:
-        List of embeddings matching input order
+        Float32 array of shape (len(texts), dims) matching input order
     """
     model = model or settings.OPENAI_EMBEDDING_MODEL
     batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
@@ -114,7 +229,7 @@ def get_embeddings(texts: List[str], model: Optional[str] = None, batch_size: Op
     
     if not texts:
         logger.debug("empty_texts_list_for_embeddings")
-        return []
+        return np.empty((0, 0), dtype=np.float32)
     
     logger.info(
         "batch_embedding_started",
@@ -123,84 +238,208 @@ def get_embeddings(texts: List[str], model: Optional[str] = None, batch_size: Op
         model=model
     )
     
-    # Clean and validate texts
-    cleaned_texts = [text.replace("\n", " ").strip() for text in texts]
-    
-    if any(not text for text in cleaned_texts):
-        logger.error("empty_text_in_batch")
-        raise ValueError("Cannot generate embeddings for empty texts")
-    
-    embeddings = []
-    total_batches = (len(cleaned_texts) + batch_size - 1) // batch_size
-    
-    # Process in batches for efficiency
-    for i in range(0, len(cleaned_texts), batch_size):
-        batch = cleaned_texts[i:i + batch_size]
-        batch_num = i // batch_size + 1
-        
+    # Clean and validate in one traversal: translate is a single pass
+    # per string, and catching empties here names the offending index
+    # instead of a second any() walk over the batch
+    cleaned_texts = []
+    for i, text in enumerate(texts):
+        cleaned = text.translate(_NL_TABLE).strip()
+        if not cleaned:
+            logger.error("empty_text_in_batch", index=i)
+            raise ValueError(f"Cannot generate embeddings for empty text at index {i}")
+        cleaned_texts.append(cleaned)
+
+    # Large offline jobs go through the Batch API when the gate is on:
+    # half the cost and far higher rate limits, at the price of
+    # asynchronous turnaround - mirrors the Anthropic batch gate used
+    # for personality analysis
+    if settings.EMBEDDING_USE_BATCH_API and len(cleaned_texts) >= settings.EMBEDDING_BATCH_API_THRESHOLD:
+        return get_embeddings_batch_api(cleaned_texts, model)
+
+    # Resolve duplicates and cache hits before any network work: chunker
+    # output repeats headers and boilerplate, and embedding the same
+    # string twice is pure spend. Only unique, uncached texts go to the
+    # API; results scatter back by content hash, so output order and
+    # length match the input exactly
+    hashes = [_compute_text_hash(t) for t in cleaned_texts]
+    resolved = {}
+    to_query: List[str] = []
+    query_hashes: List[bytes] = []
+    for text, text_hash in zip(cleaned_texts, hashes):
+        if text_hash in resolved:
+            continue
+        resolved[text_hash] = _cache_get(text_hash, model)
+        if resolved[text_hash] is None:
+            to_query.append(text)
+            query_hashes.append(text_hash)
+
+    if not to_query:
+        logger.info("batch_embedding_fully_cached", text_count=len(texts))
+        return np.stack([resolved[h] for h in hashes])
+
+    # Pre-tokenize everything in one encode_batch call and greedy-pack
+    # requests against both API limits: the input-count cap and a token
+    # budget that keeps each request comfortably under the model's
+    # per-request limit. Small texts then share one HTTP round trip
+    # instead of padding out count-only batches
+    token_counts = [len(t) for t in _get_encoding().encode_ordinary_batch(to_query)]
+
+    batches = []
+    batch_token_totals = []
+    current = []
+    current_tokens = 0
+    for text, n_tokens in zip(to_query, token_counts):
+        if current and (len(current) >= batch_size or current_tokens + n_tokens > MAX_BATCH_TOKENS):
+            batches.append(current)
+            batch_token_totals.append(current_tokens)
+            current = []
+            current_tokens = 0
+        current.append(text)
+        current_tokens += n_tokens
+    if current:
+        batches.append(current)
+        batch_token_totals.append(current_tokens)
+
+    total_batches = len(batches)
+
+    @_retry_api_call
+    def _embed_batch_call(batch: List[str], batch_tokens: int) -> List[np.ndarray]:
+        # Acquired inside the retry so a retried request re-pays its
+        # budget instead of skipping the governor
+        _rate_limiter.acquire(batch_tokens)
+        response = _get_client().embeddings.create(input=batch, model=model)
+        return [np.asarray(item.embedding, dtype=np.float32) for item in response.data]
+
+    def _embed_batch(batch_num: int, batch: List[str], batch_tokens: int) -> List[np.ndarray]:
         logger.debug(
             "processing_embedding_batch",
             batch_num=batch_num,
             total_batches=total_batches,
             batch_size=len(batch)
         )
-        
-        for attempt in range(MAX_RETRIES):
-            try:
-                with PerformanceTimer(
-                    logger,
-                    "generate_batch_embeddings",
-                    batch_num=batch_num,
-                    batch_size=len(batch),
-                    model=model
-                ):
-                    response = _get_client().embeddings.create(input=batch, model=model)
-                    batch_embeddings = [item.embedding for item in response.data]
-                    embeddings.extend(batch_embeddings)
-                
-                logger.debug("embedding_batch_successful", batch_num=batch_num)
-                break
-            except Exception as e:
-                if attempt == MAX_RETRIES - 1:
-                    logger.error(
-                        "embedding_batch_failed",
-                        batch_num=batch_num,
-                        attempts=MAX_RETRIES,
-                        error=str(e),
-                        exc_info=True
-                    )
-                    raise Exception(
-                        f"Failed to generate embeddings for batch {batch_num} "
-                        f"after {MAX_RETRIES} attempts: {e}"
-                    )
-                logger.warning(
-                    "embedding_batch_retry",
-                    batch_num=batch_num,
-                    attempt=attempt+1,
-                    error=str(e)
-                )
-                time.sleep(RETRY_DELAY * (attempt + 1))
-    
+
+        try:
+            with PerformanceTimer(
+                logger,
+                "generate_batch_embeddings",
+                batch_num=batch_num,
+                batch_size=len(batch),
+                model=model
+            ):
+                batch_embeddings = _embed_batch_call(batch, batch_tokens)
+        except Exception as e:
+            logger.error(
+                "embedding_batch_failed",
+                batch_num=batch_num,
+                error=str(e),
+                exc_info=True
+            )
+            raise
+
+        logger.debug("embedding_batch_successful", batch_num=batch_num)
+        return batch_embeddings
+
+    # Requests are independent, so dispatch them concurrently - the time
+    # is all network wait. executor.map preserves input order
+    embeddings = []
+    if total_batches == 1:
+        embeddings.extend(_embed_batch(1, batches[0], batch_token_totals[0]))
+    else:
+        with ThreadPoolExecutor(max_workers=min(settings.EMBEDDING_MAX_CONCURRENCY, total_batches)) as executor:
+            for batch_embeddings in executor.map(
+                _embed_batch, range(1, total_batches + 1), batches, batch_token_totals
+            ):
+                embeddings.extend(batch_embeddings)
+
+    for text_hash, vec in zip(query_hashes, embeddings):
+        _cache_put(text_hash, model, vec)
+        resolved[text_hash] = vec
+
     logger.info(
         "batch_embedding_completed",
         text_count=len(texts),
-        embedding_count=len(embeddings)
+        embedded_count=len(embeddings),
+        reused_count=len(texts) - len(embeddings)
     )
-    
-    return embeddings
 
-@lru_cache(maxsize=1)
+    return np.stack([resolved[h] for h in hashes])
+
+def get_embeddings_batch_api(
+    texts: List[str],
+    model: Optional[str] = None,
+    poll_interval: float = 30.0
+) -> np.ndarray:
+    """
+    Generate embeddings through OpenAI's Batch API.
+
+    Batch jobs cost half as much as synchronous requests and run under
+    much higher rate limits, with asynchronous turnaround (up to 24h,
+    usually far less). Suited to bulk re-ingestion, not interactive
+    uploads; get_embeddings routes here only behind the settings gate.
+    Texts are assumed already cleaned and non-empty.
+    """
+    model = model or settings.OPENAI_EMBEDDING_MODEL
+    client = _get_client()
+
+    lines = [
+        orjson.dumps({
+            "custom_id": str(i),
+            "method": "POST",
+            "url": "/v1/embeddings",
+            "body": {"input": text, "model": model},
+        })
+        for i, text in enumerate(texts)
+    ]
+    input_file = client.files.create(
+        file=("embeddings_batch.jsonl", b"\n".join(lines)),
+        purpose="batch"
+    )
+
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/embeddings",
+        completion_window="24h"
+    )
+    logger.info("embedding_batch_job_submitted", batch_id=batch.id, request_count=len(texts))
+
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed":
+        logger.error("embedding_batch_job_failed", batch_id=batch.id, status=batch.status)
+        raise Exception(f"Embedding batch {batch.id} ended with status {batch.status}")
+
+    output = client.files.content(batch.output_file_id)
+    by_id = {}
+    for line in output.text.splitlines():
+        if line:
+            entry = orjson.loads(line)
+            by_id[int(entry["custom_id"])] = np.asarray(
+                entry["response"]["body"]["data"][0]["embedding"], dtype=np.float32
+            )
+
+    logger.info("embedding_batch_job_completed", batch_id=batch.id, embedding_count=len(by_id))
+    return np.stack([by_id[i] for i in range(len(texts))])
+
+@lru_cache(maxsize=None)
 def _get_encoding(encoding_name: str = "cl100k_base"):
-    """Cache tokenizer encoding"""
+    """Cache tokenizer encodings, loaded on first use - fetching the BPE
+    ranks can touch the network on a cold machine, so importing this
+    module must not trigger it"""
     return tiktoken.get_encoding(encoding_name)
 
+@lru_cache(maxsize=4096)
+def _token_len(text: str, encoding_name: str) -> int:
+    """Memoized token count - chunk-then-embed pipelines measure the same strings repeatedly"""
+    return len(_get_encoding(encoding_name).encode_ordinary(text))
+
 def count_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
     """
     Count tokens in text efficiently with cached encoding.
     Uses cl100k_base (GPT-4, text-embedding-3 models)
     """
-    encoding = _get_encoding(encoding_name)
-    return len(encoding.encode(text))
+    return _token_len(text, encoding_name)
 
 def chunk_text(
     text: str,
@@ -225,106 +464,152 @@ def chunk_text(
     if not text.strip():
         return []
     
-    encoding = _get_encoding("cl100k_base")
-    tokens = encoding.encode(text)
+    encoding = _get_encoding()
+    tokens = encoding.encode_ordinary(text)
     
     if len(tokens) <= chunk_size:
         return [text]
     
-    chunks = []
-    start = 0
-    
-    while start < len(tokens):
-        end = min(start + chunk_size, len(tokens))
-        chunk_tokens = tokens[start:end]
-        chunk_text = encoding.decode(chunk_tokens)
-        chunks.append(chunk_text.strip())
-        
-        if end >= len(tokens):
+    # Collect all the slices first, then decode them in one decode_batch
+    # call: one FFI crossing and parallel decoding in tiktoken's Rust
+    # core instead of one decode per chunk in a Python loop
+    slices = []
+    for start in range(0, len(tokens), chunk_size - chunk_overlap):
+        slices.append(tokens[start:start + chunk_size])
+        if start + chunk_size >= len(tokens):
             break
-            
-        start += chunk_size - chunk_overlap
-    
-    return chunks
 
-def semantic_chunk_text(text: str, max_chunk_size: Optional[int] = None) -> List[str]:
+    return [chunk.strip() for chunk in encoding.decode_batch(slices)]
+
+def iter_semantic_chunks(text: str, max_chunk_size: Optional[int] = None) -> Iterator[str]:
     """
-    Chunk text based on semantic boundaries (paragraphs/sentences).
-    Optimized for better context preservation and retrieval quality.
-    
-    Args:
-        text: Text to chunk
-        max_chunk_size: Max tokens per chunk (default from settings)
-    
-    Returns:
-        List of semantically coherent text chunks
+    Yield semantically coherent chunks as they are packed.
+
+    Generator core of semantic_chunk_text: each chunk is emitted the
+    moment its token budget fills, so consumers like embed_stream can
+    process a document without every chunk being resident at once.
     """
     max_chunk_size = max_chunk_size or settings.CHUNK_SIZE
-    
+
     if not text.strip():
         logger.debug("empty_text_for_chunking")
-        return []
-    
-    logger.debug("semantic_chunking_started", text_length=len(text), max_chunk_size=max_chunk_size)
-    
+        return
+
     # Split by paragraphs (double newlines)
     paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-    
+
     if not paragraphs:
         logger.debug("no_paragraphs_found_returning_whole_text")
-        return [text.strip()]
-    
-    chunks = []
-    current_chunk = []
-    current_tokens = 0
-    
-    encoding = _get_encoding("cl100k_base")
-    
-    for para in paragraphs:
-        para_tokens = len(encoding.encode(para))
-        
+        yield text.strip()
+        return
+
+    encoding = _get_encoding()
+
+    # encode_batch tokenizes all paragraphs in one call (parallelized in
+    # tiktoken's Rust core) instead of one Python->Rust round trip per
+    # paragraph inside the loop. The token ids are kept and packed
+    # directly - separators counted too, so max_chunk_size is exact -
+    # and each chunk is decoded once at emit time instead of joined from
+    # strings whose combined token size was only estimated
+    para_token_lists = encoding.encode_ordinary_batch(paragraphs)
+    para_sep = encoding.encode_ordinary('\n\n')
+    space_sep = encoding.encode_ordinary(' ')
+
+    current_ids: List[int] = []
+
+    def emit(ids: List[int]) -> Optional[str]:
+        chunk = encoding.decode(ids).strip()
+        return chunk or None
+
+    for para, para_ids in zip(paragraphs, para_token_lists):
+
         # If single paragraph exceeds max size, split it
-        if para_tokens > max_chunk_size:
-            # Save current chunk if exists
-            if current_chunk:
-                chunks.append('\n\n'.join(current_chunk))
-                current_chunk = []
-                current_tokens = 0
-            
+        if len(para_ids) > max_chunk_size:
+            # Flush current chunk if exists
+            if current_ids:
+                chunk = emit(current_ids)
+                if chunk:
+                    yield chunk
+                current_ids = []
+
             # Split large paragraph by sentences
-            sentences = [s.strip() for s in para.replace('! ', '!|').replace('? ', '?|').replace('. ', '.|').split('|') if s.strip()]
-            
-            for sent in sentences:
-                sent_tokens = len(encoding.encode(sent))
-                
-                if current_tokens + sent_tokens > max_chunk_size and current_chunk:
-                    chunks.append(' '.join(current_chunk))
-                    current_chunk = [sent]
-                    current_tokens = sent_tokens
+            sentences = [s for s in (s.strip() for s in _SENT_SPLIT_RE.split(para)) if s]
+
+            for sent_ids in encoding.encode_ordinary_batch(sentences):
+                sep = space_sep if current_ids else []
+                if current_ids and len(current_ids) + len(sep) + len(sent_ids) > max_chunk_size:
+                    chunk = emit(current_ids)
+                    if chunk:
+                        yield chunk
+                    current_ids = list(sent_ids)
                 else:
-                    current_chunk.append(sent)
-                    current_tokens += sent_tokens
-        
+                    current_ids.extend(sep)
+                    current_ids.extend(sent_ids)
+
         # Normal paragraph processing
-        elif current_tokens + para_tokens > max_chunk_size and current_chunk:
-            chunks.append('\n\n'.join(current_chunk))
-            current_chunk = [para]
-            current_tokens = para_tokens
+        elif current_ids and len(current_ids) + len(para_sep) + len(para_ids) > max_chunk_size:
+            chunk = emit(current_ids)
+            if chunk:
+                yield chunk
+            current_ids = list(para_ids)
         else:
-            current_chunk.append(para)
-            current_tokens += para_tokens
-    
-    # Add remaining chunk
-    if current_chunk:
-        chunks.append('\n\n'.join(current_chunk))
-    
-    result_chunks = [chunk.strip() for chunk in chunks if chunk.strip()]
+            if current_ids:
+                current_ids.extend(para_sep)
+            current_ids.extend(para_ids)
+
+    # Emit remaining chunk
+    if current_ids:
+        chunk = emit(current_ids)
+        if chunk:
+            yield chunk
+
+
+def semantic_chunk_text(text: str, max_chunk_size: Optional[int] = None) -> List[str]:
+    """
+    Chunk text based on semantic boundaries (paragraphs/sentences).
+    Optimized for better context preservation and retrieval quality.
+
+    Args:
+        text: Text to chunk
+        max_chunk_size: Max tokens per chunk (default from settings)
+
+    Returns:
+        List of semantically coherent text chunks
+    """
+    max_chunk_size = max_chunk_size or settings.CHUNK_SIZE
+    logger.debug("semantic_chunking_started", text_length=len(text), max_chunk_size=max_chunk_size)
+
+    result_chunks = list(iter_semantic_chunks(text, max_chunk_size))
     logger.info(
         "semantic_chunking_completed",
         input_length=len(text),
         chunk_count=len(result_chunks),
         avg_chunk_size=sum(len(c) for c in result_chunks) // len(result_chunks) if result_chunks else 0
     )
-    
+
     return result_chunks
 
+
+def embed_stream(
+    chunks: Iterable[str],
+    model: Optional[str] = None,
+    batch_size: Optional[int] = None
+) -> Iterator[Tuple[str, np.ndarray]]:
+    """
+    Yield (chunk, embedding) pairs, embedding in API-sized batches.
+
+    Fuses chunking and embedding: fed from iter_semantic_chunks, peak
+    memory holds one batch of chunks and vectors rather than every chunk
+    and every 3072-dim embedding for the whole document.
+    """
+    batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
+    buf: List[str] = []
+
+    for chunk in chunks:
+        buf.append(chunk)
+        if len(buf) >= batch_size:
+            yield from zip(buf, get_embeddings(buf, model))
+            buf = []
+
+    if buf:
+        yield from zip(buf, get_embeddings(buf, model))
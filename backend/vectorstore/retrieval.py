@@ -1,6 +1,10 @@
+import asyncio
+
+import numpy as np
+
 from typing import List, Dict, Optional
 from backend.vectorstore.store import vector_store
-from backend.vectorstore.embeddings import get_embedding
+from backend.vectorstore.embeddings import get_embedding, get_embeddings
 from backend.config import settings
 from backend.logging_config import get_logger, PerformanceTimer
 
@@ -17,7 +21,8 @@ class RetrieverStrategy:
         self,
         query: str,
         context_filter: Optional[Dict] = None,
-        k: Optional[int] = None
+        k: Optional[int] = None,
+        include_embeddings: bool = False
     ) -> List[Dict]:
         """
         Retrieve most relevant chunks for a query.
@@ -26,27 +31,41 @@ class RetrieverStrategy:
         - content: The chunk text
         - metadata: Associated metadata
         - distance: Similarity score
+        - embedding: The stored vector (only when include_embeddings)
         """
         k = k or self.k
         
         logger.debug("retrieve_started", query_length=len(query), k=k, has_filter=context_filter is not None)
-        
+
+        include = ["metadatas", "documents", "distances"]
+        if include_embeddings:
+            include.append("embeddings")
+
         try:
             with PerformanceTimer(logger, "retrieve_chunks", k=k):
+                # Embed through our own client so the embedding cache
+                # applies and the query model always matches the store,
+                # instead of letting Chroma re-embed with its default
+                qvec = get_embedding(query)
                 results = vector_store.query(
-                    query_texts=[query],
+                    query_embeddings=[qvec],
                     n_results=k,
-                    where=context_filter
+                    where=context_filter,
+                    include=include
                 )
             
             retrieved = []
+            embeddings = results.get('embeddings') if include_embeddings else None
             for i in range(len(results['documents'][0])):
-                retrieved.append({
+                entry = {
                     'content': results['documents'][0][i],
                     'metadata': results['metadatas'][0][i],
                     'distance': results['distances'][0][i] if 'distances' in results else None,
                     'id': results['ids'][0][i]
-                })
+                }
+                if embeddings is not None:
+                    entry['embedding'] = embeddings[0][i]
+                retrieved.append(entry)
             
             logger.info("retrieve_completed", retrieved_count=len(retrieved), k=k)
             return retrieved
@@ -54,6 +73,60 @@ class RetrieverStrategy:
             logger.error("retrieve_error", query_length=len(query), k=k, error=str(e), exc_info=True)
             raise
     
+    def retrieve_many(
+        self,
+        queries: List[str],
+        context_filter: Optional[Dict] = None,
+        k: Optional[int] = None
+    ) -> List[List[Dict]]:
+        """
+        Retrieve for several queries in one Chroma call.
+
+        Chroma processes a list of query texts in a single query, so
+        callers fanning out over many prompts pay one round trip instead
+        of serializing per query.
+        """
+        k = k or self.k
+
+        logger.debug("retrieve_many_started", query_count=len(queries), k=k)
+
+        try:
+            with PerformanceTimer(logger, "retrieve_many_chunks", k=k, query_count=len(queries)):
+                qvecs = get_embeddings(queries)
+                results = vector_store.query(
+                    query_embeddings=qvecs,
+                    n_results=k,
+                    where=context_filter
+                )
+
+            retrieved = []
+            for j in range(len(queries)):
+                per_query = []
+                for i in range(len(results['documents'][j])):
+                    per_query.append({
+                        'content': results['documents'][j][i],
+                        'metadata': results['metadatas'][j][i],
+                        'distance': results['distances'][j][i] if 'distances' in results else None,
+                        'id': results['ids'][j][i]
+                    })
+                retrieved.append(per_query)
+
+            logger.info("retrieve_many_completed", query_count=len(queries), k=k)
+            return retrieved
+        except Exception as e:
+            logger.error("retrieve_many_error", query_count=len(queries), k=k, error=str(e), exc_info=True)
+            raise
+
+    async def aretrieve(
+        self,
+        query: str,
+        context_filter: Optional[Dict] = None,
+        k: Optional[int] = None
+    ) -> List[Dict]:
+        """Async facade over retrieve - offloads the blocking Chroma query
+        to a worker thread so handlers can overlap retrieval with other I/O"""
+        return await asyncio.to_thread(self.retrieve, query, context_filter, k)
+
     def retrieve_with_diversity(
         self,
         query: str,
@@ -70,40 +143,48 @@ class RetrieverStrategy:
         
         try:
             with PerformanceTimer(logger, "retrieve_with_diversity", k=k):
-                # Get more results than needed
-                results = self.retrieve(query, k=k * 2)
+                # Get more results than needed, with the stored vectors -
+                # diversity is scored as cosine over the embeddings Chroma
+                # already computed, not word-overlap Jaccard re-derived
+                # from the text
+                results = self.retrieve(query, k=k * 2, include_embeddings=True)
                 
                 if not results:
                     logger.info("no_results_for_diversity_retrieval")
                     return []
-                
-                # Select first result
-                selected = [results[0]]
-                remaining = results[1:]
-                
-                while len(selected) < k and remaining:
-                    # Find most diverse result from remaining
-                    best_idx = 0
-                    best_score = -float('inf')
-                    
-                    for idx, candidate in enumerate(remaining):
-                        # Calculate diversity score (simplified)
-                        min_similarity = min(
-                            self._similarity(candidate['content'], sel['content'])
-                            for sel in selected
-                        )
-                        
-                        # Balance relevance and diversity
-                        score = candidate.get('distance', 0) - (1 - min_similarity)
-                        
-                        if score > best_score:
-                            best_score = score
-                            best_idx = idx
-                    
-                    selected.append(remaining.pop(best_idx))
-            
-            logger.info("retrieve_with_diversity_completed", selected_count=len(selected[:k]), k=k)
-            return selected[:k]
+
+                # Unit-normalize once; pairwise cosine is then a single
+                # matrix product instead of per-pair Python work
+                E = np.asarray([r['embedding'] for r in results], dtype=np.float32)
+                E /= np.linalg.norm(E, axis=1, keepdims=True)
+                sim = E @ E.T
+                relevance = np.asarray(
+                    [-(r['distance'] or 0.0) for r in results], dtype=np.float32
+                )
+
+                selected = [0]
+                remaining = np.ones(len(results), dtype=bool)
+                remaining[0] = False
+                # Running max similarity to the selected set; updating it
+                # with each pick keeps every iteration O(n) instead of
+                # rescoring candidates against the whole selection
+                max_sim = sim[0].copy()
+
+                while len(selected) < k and remaining.any():
+                    # Most relevant candidate least similar to anything
+                    # already picked (standard MMR trade-off)
+                    scores = np.where(remaining, relevance - max_sim, -np.inf)
+                    best = int(np.argmax(scores))
+                    selected.append(best)
+                    remaining[best] = False
+                    np.maximum(max_sim, sim[best], out=max_sim)
+
+                picked = [results[i] for i in selected[:k]]
+                for r in picked:
+                    r.pop('embedding', None)
+
+            logger.info("retrieve_with_diversity_completed", selected_count=len(picked), k=k)
+            return picked
         except Exception as e:
             logger.error("retrieve_with_diversity_error", k=k, error=str(e), exc_info=True)
             raise
@@ -126,19 +207,6 @@ class RetrieverStrategy:
         
         return self.retrieve(query, context_filter=where_filter if where_filter else None, k=k)
     
-    def _similarity(self, text1: str, text2: str) -> float:
-        """Calculate simple similarity between texts (word overlap)"""
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        intersection = len(words1 & words2)
-        union = len(words1 | words2)
-        
-        return intersection / union if union > 0 else 0.0
-
 # Singleton instance
 retriever = RetrieverStrategy()
 
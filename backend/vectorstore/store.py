@@ -6,6 +6,13 @@ from backend.logging_config import get_logger, PerformanceTimer
 
 logger = get_logger(__name__)
 
+def _as_chroma_embeddings(embeddings):
+    """Chroma 0.4 validates embeddings as plain lists of floats, so numpy
+    arrays from the embedding layer are converted at this boundary only"""
+    if embeddings is None:
+        return None
+    return [e.tolist() if hasattr(e, "tolist") else e for e in embeddings]
+
 class VectorStore:
     def __init__(self):
         logger.info("initializing_vector_store", persist_dir=app_settings.CHROMA_PERSIST_DIR)
@@ -36,6 +43,7 @@ class VectorStore:
         
         try:
             with PerformanceTimer(logger, "add_chunks_to_chroma", chunk_count=len(ids)):
+                embeddings = _as_chroma_embeddings(embeddings)
                 if embeddings:
                     self.collection.add(
                         ids=ids,
@@ -61,7 +69,8 @@ class VectorStore:
         query_embeddings: Optional[List[List[float]]] = None,
         n_results: int = 5,
         where: Optional[Dict] = None,
-        where_document: Optional[Dict] = None
+        where_document: Optional[Dict] = None,
+        include: Optional[List[str]] = None
     ):
         """Query vector store for similar documents"""
         logger.debug(
@@ -75,10 +84,11 @@ class VectorStore:
             with PerformanceTimer(logger, "vector_store_query", n_results=n_results):
                 results = self.collection.query(
                     query_texts=query_texts,
-                    query_embeddings=query_embeddings,
+                    query_embeddings=_as_chroma_embeddings(query_embeddings),
                     n_results=n_results,
                     where=where,
-                    where_document=where_document
+                    where_document=where_document,
+                    include=include or ["metadatas", "documents", "distances"]
                 )
             
             results_count = len(results['documents'][0]) if results.get('documents') else 0